@@ -0,0 +1,29 @@
+"""
+Shared .env loading helper for the standalone scripts in this directory.
+
+The evaluation harness chains several of these scripts; each used to
+re-read and re-tokenize .env. A sentinel environment variable lets child
+processes that inherit the environment skip the parse entirely.
+"""
+
+import os
+from dotenv import load_dotenv
+
+_SENTINEL = '_DOTENV_LOADED'
+
+def load_env_once(dotenv_path=None):
+    """Load .env unless this process (or a parent) already did.
+
+    Args:
+        dotenv_path: Optional explicit path to the .env file
+
+    Returns:
+        True if the file was parsed, False if the cached environment was reused.
+        Set FORCE_RELOAD_DOTENV=1 to force a re-parse.
+    """
+    if os.environ.get(_SENTINEL) and os.environ.get('FORCE_RELOAD_DOTENV') != '1':
+        return False
+
+    load_dotenv(dotenv_path)
+    os.environ[_SENTINEL] = '1'
+    return True
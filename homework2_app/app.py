@@ -1,8 +1,8 @@
 # Author: Prof. MM Ghassemi <ghassem3@msu.edu>
 
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
-from flask_app import create_app, socketio
 
 # Load environment variables from .env file
 load_dotenv()
@@ -10,21 +10,40 @@ load_dotenv()
 #--------------------------------------------------
 # APPLICATION ENTRY POINT
 #--------------------------------------------------
-app = create_app(debug=True)
+@lru_cache(maxsize=None)
+def _create():
+    """Create the Flask app exactly once, even if imported twice."""
+    from flask_app import create_app
+    return create_app(debug=os.environ.get("FLASK_DEBUG", "true").lower() == "true")
+
+# WSGI entry point - gunicorn imports this as app:app
+app = _create()
 
 if __name__ == "__main__":
     # Get port and host from environment variables with fallbacks
     port = int(os.environ.get("PORT", "8080"))
     host = os.environ.get("FLASK_HOST", "127.0.0.1")
 
-    # Run with socketio.run() for gevent mode
-    # Note: use_reloader must be False for gevent mode compatibility
-    # For production, use gunicorn with gevent worker class
-    socketio.run(
-        app,
-        host=host,
-        port=port,
-        debug=True,
-        use_reloader=False,  # gevent mode doesn't support reloader
-        log_output=True
-    )
\ No newline at end of file
+    # Select the development server via APP_SERVER=socketio|werkzeug|uvicorn
+    # (production uses gunicorn with the gevent worker class, see Dockerfile)
+    server = os.environ.get("APP_SERVER", "socketio")
+
+    if server == "uvicorn":
+        import uvicorn
+        # Flask is WSGI; uvicorn's interface auto-detection only picks
+        # ASGI flavors, so the WSGI adapter must be requested explicitly
+        uvicorn.run(app, host=host, port=port, interface="wsgi")
+    elif server == "werkzeug":
+        app.run(host=host, port=port, debug=app.debug)
+    else:
+        # Run with socketio.run() for gevent mode
+        # Note: use_reloader must be False for gevent mode compatibility
+        from flask_app import socketio
+        socketio.run(
+            app,
+            host=host,
+            port=port,
+            debug=app.debug,
+            use_reloader=False,  # gevent mode doesn't support reloader
+            log_output=True
+        )
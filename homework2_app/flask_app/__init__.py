@@ -4,23 +4,80 @@
 # Import REQUIREMENTS
 #--------------------------------------------------
 import os
+import random
 import time
-from flask import Flask
+import psycopg2
+from flask import Flask, request
 from flask_socketio import SocketIO
 from flask_failsafe import failsafe
 
+# Serialize JSON with orjson's C encoder when it is installed - jsonify
+# payloads (resume data, orchestrator responses) can be multi-KB. Falls
+# back to Flask's default provider otherwise.
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    # Non-string dict keys and numpy scalars both show up in benchmark
+    # metrics payloads; these options let orjson serialize them directly
+    # instead of raising
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    class OrjsonSocketIOJson:
+        """Minimal json-module shim (dumps/loads) for Flask-SocketIO."""
+
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+        @staticmethod
+        def loads(s, **kwargs):
+            return orjson.loads(s)
+except ImportError:
+    OrjsonProvider = None
+    OrjsonSocketIOJson = None
+
 #--------------------------------------------------
 # CONFIGURATION CONSTANTS
 #--------------------------------------------------
 DB_MAX_RETRIES = 30
 DB_RETRY_DELAY = 2
+DB_RETRY_MAX_SLEEP = 30
+DB_RETRY_DEADLINE = 120
+
+# No-cache headers applied to every response - built once instead of
+# allocating three header strings per request
+NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate, public, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
 
 #--------------------------------------------------
 # GLOBAL INSTANCES
 #--------------------------------------------------
-# Use gevent mode for compatibility (gevent is installed)
-# Note: For uvicorn ASGI, use async_mode='asyncio' with proper ASGI setup
-socketio = SocketIO(async_mode='gevent', cors_allowed_origins="*")
+# Async mode is env-selectable so deployments can pick the event loop that
+# matches their worker class (gunicorn gevent workers by default; set
+# SOCKETIO_ASYNC_MODE=threading for plain WSGI servers without gevent).
+# Flask-SocketIO has no native ASGI mode - a uvicorn deployment would need
+# a port to python-socketio's AsyncServer.
+SOCKETIO_ASYNC_MODE = os.environ.get('SOCKETIO_ASYNC_MODE', 'gevent')
+
+# Emit payloads (multi-KB synthesized chat answers) with orjson when it is
+# installed; Flask-SocketIO otherwise falls back to its stdlib serializer
+_socketio_kwargs = {'async_mode': SOCKETIO_ASYNC_MODE, 'cors_allowed_origins': "*"}
+if OrjsonSocketIOJson is not None:
+    _socketio_kwargs['json'] = OrjsonSocketIOJson
+socketio = SocketIO(**_socketio_kwargs)
 
 #--------------------------------------------------
 # DATABASE INITIALIZATION
@@ -29,14 +86,20 @@ def initialize_database():
     """
     Initialize database with retry logic and proper error handling.
     
+    Retries transient connection failures (psycopg2.OperationalError) with
+    exponential backoff and full jitter so multiple workers booting against
+    a slow Postgres don't reconnect in lockstep. Non-transient errors
+    (bad credentials, broken SQL) are raised immediately.
+
     Returns:
         database: Initialized database instance
-        
+
     Raises:
-        Exception: If database connection fails after all retry attempts
+        Exception: If database connection fails after the retry deadline
     """
     from .utils.database import database
-    
+
+    start = time.monotonic()
     for attempt in range(DB_MAX_RETRIES):
         try:
             db = database()
@@ -45,14 +108,15 @@ def initialize_database():
             print("Database tables created successfully")
             print("Database tables and initial data imported successfully")
             return db
-        except Exception as e:
+        except psycopg2.OperationalError as e:
             print(f"Database connection failed (attempt {attempt + 1}/{DB_MAX_RETRIES}): {e}")
-            if attempt < DB_MAX_RETRIES - 1:
-                print(f"Retrying in {DB_RETRY_DELAY} seconds...")
-                time.sleep(DB_RETRY_DELAY)
-            else:
-                print("Failed to connect to database after all retries")
+            if attempt >= DB_MAX_RETRIES - 1 or time.monotonic() - start > DB_RETRY_DEADLINE:
+                print("Failed to connect to database within the retry deadline")
                 raise
+            # Full jitter: sleep a random amount up to the capped exponential
+            delay = random.uniform(0, min(DB_RETRY_MAX_SLEEP, DB_RETRY_DELAY * (2 ** attempt)))
+            print(f"Retrying in {delay:.1f} seconds...")
+            time.sleep(delay)
 
 #--------------------------------------------------
 # CONFIGURATION MANAGEMENT
@@ -87,6 +151,12 @@ def apply_app_settings(app, debug=False):
     # Prevent issues with cached static files
     app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
     app.debug = debug
+
+    # When a fronting server (nginx/Apache) handles X-Sendfile, let it serve
+    # static file bytes via kernel sendfile() instead of streaming them
+    # through the Python process. Opt-in because the bare gunicorn
+    # deployment has no proxy to honor the header.
+    app.use_x_sendfile = os.environ.get('USE_X_SENDFILE', 'false').lower() == 'true'
     
     # Secret key is already set by config.py or fallback
     # No need to override it here
@@ -94,7 +164,18 @@ def apply_app_settings(app, debug=False):
 #--------------------------------------------------
 # APPLICATION FACTORY
 #--------------------------------------------------
-@failsafe
+def _maybe_failsafe(func):
+    """
+    Apply flask_failsafe only when the debug reloader is in play.
+
+    The failsafe wrapper exists to keep the dev reloader alive through
+    import errors; production workers don't need the extra call layer.
+    """
+    if os.environ.get('FLASK_DEBUG', 'true').lower() == 'true':
+        return failsafe(func)
+    return func
+
+@_maybe_failsafe
 def create_app(debug=False):
     """
     Create and configure the Flask application.
@@ -107,6 +188,10 @@ def create_app(debug=False):
     """
     app = Flask(__name__)
 
+    # Use the faster JSON provider for jsonify/request.get_json when available
+    if OrjsonProvider is not None:
+        app.json = OrjsonProvider(app)
+
     # Load configuration
     load_configuration(app, debug)
     
@@ -127,24 +212,34 @@ def create_app(debug=False):
             print(f"Failed to initialize database: {e}")
             raise
 
+        # Share the instance with routes via app.extensions so the routes
+        # module doesn't open its own connection at import time
+        app.extensions['db'] = db
+
         # Register socket events
         from .utils.socket_events import register_socket_events
         register_socket_events(socketio, db)
 
-    # Add context processor for cache-busting
+    # Add context processor for cache-busting. The tag is fixed per process
+    # (or per deploy via BUILD_SHA) instead of changing every second, so
+    # browsers can actually cache static assets between requests.
+    build_tag = os.environ.get('BUILD_SHA') or str(int(time.time()))
+    cache_context = {'cache_buster': build_tag}
+
     @app.context_processor
     def cache_buster():
-        """Provide cache-busting timestamp for static assets."""
-        import time
-        return {'cache_buster': int(time.time())}
+        """Provide cache-busting tag for static assets."""
+        return cache_context
 
     # Add request/response middleware
     @app.after_request
     def add_header(r):
         """Add headers to prevent caching issues."""
-        r.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, public, max-age=0"
-        r.headers["Pragma"] = "no-cache"
-        r.headers["Expires"] = "0"
+        # API responses manage their own caching (e.g. /api/resume's ETag);
+        # skipping them avoids mutating headers on every JSON response
+        if request.path.startswith('/api/'):
+            return r
+        r.headers.update(NO_CACHE_HEADERS)
         return r
 
     return app
@@ -4,13 +4,19 @@
 # All sensitive values should be loaded from environment variables.
 # Default values provided are for development only.
 
+import atexit
 import os
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from dotenv import load_dotenv
 
-# Load environment variables from .env file if it exists
-load_dotenv()
+# Load environment variables from .env file if it exists. Production
+# containers get their environment from the orchestrator, so skip the
+# filesystem search there; the explicit path also avoids dotenv walking
+# parent directories looking for a .env.
+if os.environ.get('ENVIRONMENT', 'development') == 'development':
+    load_dotenv(dotenv_path=os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env'))
 
 class Config:
     """
@@ -146,12 +152,21 @@ class Config:
         console_handler.setLevel(log_level)
         console_handler.setFormatter(log_format)
 
+        # Route records through a queue so request handlers never block on
+        # disk writes or rotation - a background listener thread does the
+        # actual I/O for both handlers
+        log_queue = queue.Queue(-1)
+        queue_handler = QueueHandler(log_queue)
+        listener = QueueListener(log_queue, file_handler, console_handler,
+                                 respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+
         # Configure root logger
         root_logger = logging.getLogger()
         root_logger.setLevel(logging.DEBUG)
         root_logger.handlers.clear()
-        root_logger.addHandler(file_handler)
-        root_logger.addHandler(console_handler)
+        root_logger.addHandler(queue_handler)
 
         # Set Flask app logger
         app.logger.setLevel(log_level)
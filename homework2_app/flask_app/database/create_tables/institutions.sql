@@ -12,3 +12,9 @@ embedding      vector(768)   DEFAULT NULL
 
 CREATE INDEX IF NOT EXISTS institutions_embedding_idx
 ON institutions USING ivfflat (embedding vector_cosine_ops);
+
+-- Trigram index so substring lookups (name ILIKE '%Michigan State%')
+-- can probe an index instead of sequential-scanning the table
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX IF NOT EXISTS institutions_name_trgm_idx
+ON institutions USING gin (name gin_trgm_ops);
@@ -0,0 +1,24 @@
+-- Semantic cache of LLM responses
+-- Stores completed responses with 768-dim message embeddings so
+-- paraphrased repeats of a question can be served without an LLM call
+
+CREATE TABLE IF NOT EXISTS llm_cache (
+    cache_id      SERIAL PRIMARY KEY,
+    namespace     varchar(200) NOT NULL,   -- expert role (or system-prompt digest) the entry belongs to
+    message       text NOT NULL,           -- original message, kept for inspection
+    response      json NOT NULL,           -- full send_message result dict
+    embedding     vector(768) DEFAULT NULL,
+    created_at    timestamp DEFAULT CURRENT_TIMESTAMP
+);
+
+-- IVFFlat index on embedding for fast similarity lookup
+CREATE INDEX IF NOT EXISTS llm_cache_embedding_idx
+ON llm_cache USING ivfflat (embedding vector_cosine_ops);
+
+-- Namespace filter runs on every lookup
+CREATE INDEX IF NOT EXISTS llm_cache_namespace_idx
+ON llm_cache (namespace);
+
+-- Age-based eviction scans by creation time
+CREATE INDEX IF NOT EXISTS llm_cache_created_at_idx
+ON llm_cache (created_at DESC);
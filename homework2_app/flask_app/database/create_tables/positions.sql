@@ -11,3 +11,7 @@ FOREIGN KEY (inst_id) REFERENCES institutions(inst_id)
 
 CREATE INDEX IF NOT EXISTS positions_embedding_idx
 ON positions USING ivfflat (embedding vector_cosine_ops);
+
+-- Trigram index for substring lookups on title (title ILIKE '%...%')
+CREATE INDEX IF NOT EXISTS positions_title_trgm_idx
+ON positions USING gin (title gin_trgm_ops);
@@ -10,9 +10,10 @@
 # - Benchmark testing routes
 
 from flask import current_app as app
-from flask import render_template, redirect, request, session, url_for, jsonify, send_from_directory
+from flask import render_template, redirect, request, session, url_for, jsonify, send_from_directory, Response, g
+from flask_app import NO_CACHE_HEADERS
 from .utils.database import database
-from .utils.llm import GroqClient
+from .utils.llm import get_groq_client
 from .utils.llm import handle_ai_chat_request
 from .utils.llm import handle_ai_chat_request_react
 from .utils.llm import execute_orchestrator_response
@@ -21,24 +22,176 @@ from .utils.llm import assess_message_risk
 from .utils.a2a_protocol import A2AProtocol, A2AMessage
 from .utils.evaluation_agent import EvaluationAgent
 from .utils.web_crawler import WebCrawlerAgent
-from bs4 import BeautifulSoup
+import hashlib
 import json
 import logging
+import re
+import string
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Prefer orjson for raw JSON string responses; fall back to stdlib json
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_dumps = json.dumps
+
+# Use lxml's C tokenizer for HTML cleaning when installed; the pure-Python
+# html.parser backend is several times slower on large pages
+try:
+    import lxml  # noqa: F401
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _BS4_PARSER = 'html.parser'
+
+# selectolax's Lexbor C parser is roughly an order of magnitude faster than
+# BeautifulSoup for the strip-tags-and-get-text pattern used here; when it
+# is installed clean_html_content uses it and skips BeautifulSoup entirely
+try:
+    from selectolax.parser import HTMLParser as _SelectolaxHTMLParser
+except ImportError:
+    _SelectolaxHTMLParser = None
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Collapses any run of whitespace to a single space in one C-level pass,
+# replacing the splitlines/split/join cascade that walked the text three times
+_WS_RE = re.compile(r'\s+')
+
+# System prompt template for page-aware chat, compiled once at import so the
+# hot chat path only substitutes the three variable fields instead of
+# re-evaluating a multi-line f-string per request
+_PAGE_PROMPT_TPL = string.Template("""
+    You are a helpful AI assistant. You have access to the current page content that the user is viewing.
+    IMPORTANT INSTRUCTIONS:
+    1. If the user's question is related to the content on the current page, use that content to provide accurate and relevant answers.
+    2. Reference specific information from the page when it helps answer the user's question.
+    3. If the user asks about something not covered on the current page, provide general helpful information.
+    4. Be conversational and helpful while maintaining accuracy.
+
+    CURRENT PAGE CONTENT:
+    Title:   $title
+    URL:     $url
+    Content: $content
+
+    Use this content to provide contextually relevant responses when appropriate.
+""")
+
+# Constant fallback prompt shared by every request without page content
+_FALLBACK_PROMPT = "You are a helpful AI assistant."
+
+# Cleaned-text cache keyed on a digest of the raw HTML, so repeated page
+# context (every benchmark test case shares one) is parsed once. Keyed on a
+# 16-byte blake2b digest rather than the raw string to keep multi-KB HTML
+# out of the cache keys.
+_CLEAN_CACHE = {}
+_CLEAN_CACHE_MAX = 256
+
+def _clean_html_cached(html_content, digest=None):
+    """Return clean_html_content(html_content), memoized by content digest."""
+    if digest is None:
+        digest = hashlib.blake2b(html_content.encode(), digest_size=16).digest()
+    cached = _CLEAN_CACHE.get(digest)
+    if cached is None:
+        if len(_CLEAN_CACHE) >= _CLEAN_CACHE_MAX:
+            _CLEAN_CACHE.clear()
+        cached = clean_html_content(html_content)
+        _CLEAN_CACHE[digest] = cached
+    return cached
+
+# Fully-built prompt cache keyed on (title, url, content digest) so repeat
+# requests against the same page skip both the cleaning and the multi-KB
+# string substitution
+_PROMPT_CACHE = {}
+_PROMPT_CACHE_MAX = 256
+
+def _page_system_prompt(page_content):
+    """
+    Build the system prompt for a chat request given its page context.
+
+    Args:
+        page_content: Dict with title/url/content keys, or None
+
+    Returns:
+        str: Page-aware prompt, or the fallback when there is no content
+    """
+    if not (page_content and page_content.get('content')):
+        return _FALLBACK_PROMPT
+
+    raw_content = page_content.get('content', '')
+    title = page_content.get('title', 'Unknown page')
+    url = page_content.get('url', 'N/A')
+
+    digest = hashlib.blake2b(raw_content.encode(), digest_size=16).digest()
+    key = (title, url, digest)
+    prompt = _PROMPT_CACHE.get(key)
+    if prompt is None:
+        if len(_PROMPT_CACHE) >= _PROMPT_CACHE_MAX:
+            _PROMPT_CACHE.clear()
+        # Only run the HTML cleaner when the content can actually contain
+        # markup - BeautifulSoup's tree build is expensive on plain text
+        if '<' in raw_content:
+            clean_content = _clean_html_cached(raw_content, digest)
+        else:
+            clean_content = raw_content
+        prompt = _PAGE_PROMPT_TPL.substitute(title=title, url=url, content=clean_content)
+        _PROMPT_CACHE[key] = prompt
+    return prompt
+
 #==================================================
 # GLOBAL INSTANCES
 #==================================================
-# Database instance for data operations
-db = database()
-
 # Agent-to-Agent protocol handler for inter-agent communication
 a2a_protocol = A2AProtocol()
 
-# Evaluation agent for running benchmarks
-evaluation_agent = EvaluationAgent(a2a_protocol, db)
+def _db():
+    """
+    Return the database instance created by the app factory.
+
+    The instance lives in app.extensions['db'], so importing this module no
+    longer opens a connection of its own. Falls back to constructing one
+    lazily if the factory has not stored it yet (e.g. during early imports).
+    """
+    db = app.extensions.get('db')
+    if db is None:
+        db = database()
+        app.extensions['db'] = db
+    return db
+
+def _evaluation_agent():
+    """
+    Return the process-wide evaluation agent, creating it on first use.
+    """
+    agent = app.extensions.get('evaluation_agent')
+    if agent is None:
+        agent = EvaluationAgent(a2a_protocol, _db())
+        app.extensions['evaluation_agent'] = agent
+    return agent
+
+@lru_cache(maxsize=1024)
+def _decrypt_session_email(token):
+    """Memoize Fernet decryption of a session email token."""
+    return _db().reversibleEncrypt('decrypt', token)
+
+def _user_email():
+    """
+    Resolve the logged-in user's email at most once per request.
+
+    The decrypted value is stashed on flask.g for the request, and the
+    Fernet decrypt itself is memoized across requests since the session
+    token is stable for the lifetime of a login.
+    """
+    if 'user_email' not in g:
+        token = session.get('email')
+        g.user_email = _decrypt_session_email(token) if token else 'Unknown'
+    return g.user_email
 
 #==================================================
 # MAIN APPLICATION ROUTES
@@ -50,7 +203,7 @@ def home():
     Render the home page.
     Displays the main landing page of the application.
     """
-    return render_template('dynamic-page.html', user=db.get_user_email(), page_type='home')
+    return render_template('dynamic-page.html', user=_user_email(), page_type='home')
 
 @app.route('/agents')
 def agents():
@@ -58,7 +211,7 @@ def agents():
     Render the AI agents page.
     Lists available AI agents that users can interact with.
     """
-    return render_template('dynamic-page.html', user=db.get_user_email(), page_type='agents')
+    return render_template('dynamic-page.html', user=_user_email(), page_type='agents')
 
 @app.route('/agents/resume')
 def resume():
@@ -66,18 +219,39 @@ def resume():
     Render the resume page with AI agent support.
     Shows the resume with an integrated AI chat assistant.
     """
-    return render_template('dynamic-page.html', user=db.get_user_email(), page_type='resume')
+    return render_template('dynamic-page.html', user=_user_email(), page_type='resume')
+
+def _resume_payload():
+    """
+    Build (once per process) the serialized resume JSON and its ETag.
+
+    The resume only changes on redeploy, so the dozens of queries behind
+    getResumeData() and the JSON encode are paid on the first request and
+    reused afterwards.
+    """
+    cached = app.extensions.get('resume_payload')
+    if cached is None:
+        body = _json_dumps({"success": True, "data": _db().getResumeData()}).encode()
+        etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+        cached = (body, etag)
+        app.extensions['resume_payload'] = cached
+    return cached
 
 @app.route('/api/resume')
 def api_resume():
     """
     API endpoint to serve resume data as JSON for Vue.js frontend.
 
+    Serves a prebuilt byte blob with an ETag so repeat visits revalidate
+    with a 304 instead of re-querying the database.
+
     Returns:
         JSON response with success status and resume data
     """
-    resume_data = db.getResumeData()
-    return jsonify({ "success": True, "data": resume_data})
+    body, etag = _resume_payload()
+    if request.headers.get('If-None-Match') == etag:
+        return '', 304
+    return Response(body, mimetype='application/json', headers={'ETag': etag})
 
 #==================================================
 # CHAT ROUTES
@@ -118,7 +292,7 @@ def chat_with_ai():
 
             # Execute the pending action
             if USE_REACT:
-                return jsonify(handle_ai_chat_request_react(GroqClient(), pending['message'], 'main', page_content))
+                return jsonify(handle_ai_chat_request_react(get_groq_client(), pending['message'], 'main', page_content))
             else:
                 return process_orchestrator_request(pending['message'], page_content)
 
@@ -170,43 +344,20 @@ def process_orchestrator_request(message, page_content):
     logger.info(f"Processing request via {'ReAct' if USE_REACT else 'Orchestrator'}")
 
     # Create LLM client
-    groq = GroqClient()
+    groq = get_groq_client()
 
     # Create a dynamic system prompt that leverages page content when relevant
-    if page_content and page_content.get('content'):
-
-        # Clean HTML content to get clean text
-        clean_content = clean_html_content(page_content.get('content', ''))
-
-        # Specify prompt to use when responding to the user's message
-        system_prompt = f"""
-            You are a helpful AI assistant. You have access to the current page content that the user is viewing.
-            IMPORTANT INSTRUCTIONS:
-            1. If the user's question is related to the content on the current page, use that content to provide accurate and relevant answers.
-            2. Reference specific information from the page when it helps answer the user's question.
-            3. If the user asks about something not covered on the current page, provide general helpful information.
-            4. Be conversational and helpful while maintaining accuracy.
-
-            CURRENT PAGE CONTENT:
-            Title:   {page_content.get('title', 'Unknown page')}
-            URL:     {page_content.get('url', 'N/A')}
-            Content: {clean_content}
-
-            Use this content to provide contextually relevant responses when appropriate.
-        """
-
-    else:
-        # Fallback system prompt when no page content is available
-        system_prompt = "You are a helpful AI assistant."
-        print("Using fallback system prompt (no page content available)")
+    system_prompt = _page_system_prompt(page_content)
+    if system_prompt is _FALLBACK_PROMPT:
+        logger.debug("Using fallback system prompt (no page content available)")
 
     # Use ReAct orchestrator if enabled, otherwise use original orchestrator
     if USE_REACT:
-        print("Using ReAct orchestrator")
+        logger.debug("Using ReAct orchestrator")
         result = handle_ai_chat_request_react(groq, message, 'main', page_content)
         return jsonify(result)
     else:
-        print("Using original orchestrator")
+        logger.debug("Using original orchestrator")
         # Use orchestrator by default for multi-expert coordination (don't emit raw plan to socket)
         orchestrator_response = handle_ai_chat_request(llm_client=groq, message=message, system_prompt=system_prompt, room='main', page_content=page_content, role="Orchestrator", emit_to_socket=False)
 
@@ -215,7 +366,7 @@ def process_orchestrator_request(message, page_content):
 
         if response_data.get('success'):
             orchestrator_plan = response_data.get('response', '')
-            print(f"Orchestrator plan: {orchestrator_plan}")
+            logger.debug("Orchestrator plan: %s", orchestrator_plan)
 
             # Execute the orchestrator's plan (this will emit the final synthesized response)
             execution_result = execute_orchestrator_response(orchestrator_plan, message, page_content)
@@ -235,7 +386,7 @@ def login():
     Render the login page.
     Displays the user authentication form.
     """
-    return render_template('dynamic-page.html', user=db.get_user_email(), page_type='login')
+    return render_template('dynamic-page.html', user=_user_email(), page_type='login')
 
 @app.route('/processlogin', methods=["POST", "GET"])
 def processlogin():
@@ -254,15 +405,15 @@ def processlogin():
 
     # Validate required fields
     if not email or not password:
-        return json.dumps({"success": 0,"error": "Email and password are required"})
+        return _json_dumps({"success": 0,"error": "Email and password are required"})
 
     # Check if the username and password match
-    status = db.authenticate(email=email, password=password)
+    status = _db().authenticate(email=email, password=password)
 
     # Encrypt email and store it in the session
-    session['email'] = db.reversibleEncrypt('encrypt', email)
+    session['email'] = _db().reversibleEncrypt('encrypt', email)
 
-    return json.dumps(status)
+    return _json_dumps(status)
 
 @app.route('/logout')
 def logout():
@@ -322,9 +473,6 @@ def crawl_endpoint():
                 "error": "No URL provided"
             }), 400
 
-        # Import A2AProtocol to create proper message
-        from .utils.a2a_protocol import A2AMessage
-
         # Create crawler instance
         crawler = WebCrawlerAgent()
 
@@ -377,9 +525,10 @@ def add_header(r):
     Add headers to prevent caching issues.
     Ensures fresh content is always served.
     """
-    r.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, public, max-age=0"
-    r.headers["Pragma"] = "no-cache"
-    r.headers["Expires"] = "0"
+    # API responses manage their own caching (e.g. /api/resume's ETag)
+    if request.path.startswith('/api/'):
+        return r
+    r.headers.update(NO_CACHE_HEADERS)
     return r
 
 def clean_html_content(html_content):
@@ -398,28 +547,41 @@ def clean_html_content(html_content):
     if not html_content:
         return ""
 
+    # Skip the parser entirely when the input can't contain markup - tiny
+    # inputs and plain text (common in benchmark page_context fixtures)
+    # only need whitespace normalization. Scanning the first 4KB is enough
+    # to detect real HTML documents.
+    if len(html_content) < 64 or '<' not in html_content[:4096]:
+        return _WS_RE.sub(' ', html_content).strip()
+
     try:
+        # Fast path: selectolax does the whole strip-and-extract in C
+        if _SelectolaxHTMLParser is not None:
+            tree = _SelectolaxHTMLParser(html_content)
+            for tag in ("script", "style", "nav", "footer", "header", "aside"):
+                for node in tree.css(tag):
+                    node.decompose()
+            text = tree.body.text(separator=' ') if tree.body else ''
+            return _WS_RE.sub(' ', text).strip()
+
+        # Imported here rather than at module scope - BeautifulSoup is only
+        # needed on this path and costs noticeable import time and memory
+        from bs4 import BeautifulSoup
+
         # Parse HTML with Beautiful Soup
-        soup = BeautifulSoup(html_content, 'html.parser')
+        soup = BeautifulSoup(html_content, _BS4_PARSER)
 
         # Remove script, style, and other non-content elements
         for element in soup(["script", "style", "nav", "footer", "header", "aside"]):
             element.decompose()
 
-        # Get text and clean it up
-        text = soup.get_text()
-
-        # Clean up whitespace and normalize
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-
-        # Remove excessive whitespace
-        text = ' '.join(text.split())
+        # Get text with a space separator, then collapse whitespace runs
+        # in a single regex pass
+        text = _WS_RE.sub(' ', soup.get_text(separator=' ')).strip()
 
         return text
     except Exception as e:
-        print(f"Error cleaning HTML content: {e}")
+        logger.error("Error cleaning HTML content: %s", e)
         # Fallback: return original content if cleaning fails
         return html_content
 
@@ -447,7 +609,7 @@ def a2a_handler():
         # Parse A2A message from request
         a2a_message = A2AMessage.from_dict(data)
 
-        print(f"Received A2A message: {a2a_message.action} from {a2a_message.sender}")
+        logger.debug("Received A2A message: %s from %s", a2a_message.action, a2a_message.sender)
 
         # Handle different A2A actions
         if a2a_message.action == "chat_request":
@@ -456,31 +618,12 @@ def a2a_handler():
             page_context = a2a_message.params.get('page_context', {})
 
             # Create LLM client
-            groq = GroqClient()
+            groq = get_groq_client()
 
             # Build system prompt
-            if page_context and page_context.get('content'):
-                clean_content = clean_html_content(page_context.get('content', ''))
-                system_prompt = f"""
-                    You are a helpful AI assistant. You have access to the current page content that the user is viewing.
-                    IMPORTANT INSTRUCTIONS:
-                    1. If the user's question is related to the content on the current page, use that content to provide accurate and relevant answers.
-                    2. Reference specific information from the page when it helps answer the user's question.
-                    3. If the user asks about something not covered on the current page, provide general helpful information.
-                    4. Be conversational and helpful while maintaining accuracy.
-
-                    CURRENT PAGE CONTENT:
-                    Title:   {page_context.get('title', 'Unknown page')}
-                    URL:     {page_context.get('url', 'N/A')}
-                    Content: {clean_content}
-
-                    Use this content to provide contextually relevant responses when appropriate.
-                """
-            else:
-                system_prompt = "You are a helpful AI assistant."
+            system_prompt = _page_system_prompt(page_context)
 
             # Get AI response
-            groq = GroqClient()
             ai_result = groq.send_message(
                 message=message,
                 conversation_history=[],
@@ -511,12 +654,52 @@ def a2a_handler():
             return jsonify(error_response.to_dict()), 400
 
     except Exception as e:
-        print(f"Error in A2A handler: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error in A2A handler: %s", e)
+        logger.debug(traceback.format_exc())
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+@app.route('/api/a2a/stream', methods=['POST'])
+def a2a_stream_handler():
+    """
+    Streaming variant of the A2A chat_request handler.
+
+    Returns the LLM response as Server-Sent Events, one token chunk per
+    event, so the client renders incrementally and the worker isn't held
+    for the full generation before the first byte goes out. Only the
+    "chat_request" action is supported.
+    """
+    data = request.get_json()
+    a2a_message = A2AMessage.from_dict(data)
+
+    if a2a_message.action != "chat_request":
+        return jsonify({
+            "success": False,
+            "error": f"Unsupported action for streaming: {a2a_message.action}"
+        }), 400
+
+    message = a2a_message.params.get('message', '')
+    page_context = a2a_message.params.get('page_context', {})
+
+    groq = get_groq_client()
+    system_prompt = _page_system_prompt(page_context)
+
+    def generate():
+        try:
+            for delta in groq.send_message_stream(
+                message=message,
+                conversation_history=[],
+                system_prompt=system_prompt
+            ):
+                yield f"data: {_json_dumps({'delta': delta})}\n\n"
+            yield "data: [DONE]\n\n"
+        except Exception as e:
+            yield f"data: {_json_dumps({'error': str(e)})}\n\n"
+
+    return Response(generate(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
 #==================================================
 # BENCHMARK ROUTES
 #==================================================
@@ -527,7 +710,7 @@ def benchmark_dashboard():
     Render the benchmark dashboard page.
     Displays testing interface for AI agent evaluation.
     """
-    return render_template('dynamic-page.html', user=db.get_user_email(), page_type='benchmark')
+    return render_template('dynamic-page.html', user=_user_email(), page_type='benchmark')
 
 
 @app.route('/api/benchmark/run', methods=['POST'])
@@ -545,10 +728,8 @@ def run_benchmark():
         data = request.get_json() or {}
         category = data.get('category')
 
-        print(f"\n{'='*60}")
-        print(f"API Request: Running Benchmark Suite")
-        print(f"Category Filter: {category if category else 'All'}")
-        print(f"{'='*60}\n")
+        logger.info("API Request: Running Benchmark Suite (category: %s)",
+                    category if category else 'All')
 
         # Run benchmark suite synchronously
         result = run_benchmark_sync(category=category)
@@ -556,12 +737,76 @@ def run_benchmark():
         return jsonify(result)
 
     except Exception as e:
-        print(f"Error running benchmark: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error running benchmark: %s", e)
+        logger.debug(traceback.format_exc())
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+def _run_one_benchmark_test(test_case, groq, evaluator):
+    """
+    Run a single benchmark test case: LLM call plus evaluation.
+
+    Safe to call from worker threads - the database write is deliberately
+    left to the caller so only the request thread touches the database.
+
+    Args:
+        test_case: Test case row from benchmark_test_cases
+        groq: Shared GroqClient instance
+        evaluator: Shared EvaluationAgent instance
+
+    Returns:
+        Dictionary with the evaluation outcome and the fields to store
+    """
+    input_message = test_case['input_message']
+    # page_context arrives pre-decoded from the DB layer
+    page_context = test_case.get('page_context')
+
+    # Send request via A2A - timed with the monotonic ns counter so the
+    # measurement is integer math and immune to wall-clock adjustments
+    start_ns = time.perf_counter_ns()
+
+    a2a_protocol.send_request(
+        sender="evaluation_agent",
+        recipient="chat_agent",
+        action="chat_request",
+        params={
+            "message": input_message,
+            "page_context": page_context
+        }
+    )
+
+    # Get response directly from LLM (simplified for synchronous version)
+    ai_result = groq.send_message(
+        message=input_message,
+        conversation_history=[],
+        system_prompt=_page_system_prompt(page_context)
+    )
+
+    agent_response = ai_result.get('response', 'Error processing request')
+    execution_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+    # Evaluate response
+    passed, error_message = evaluator.evaluate_response(
+        actual_response=agent_response,
+        expected_response=test_case['expected_output'],
+        comparison_type=test_case['expected_output_type']
+    )
+
+    return {
+        "test_id": test_case['test_id'],
+        "test_name": test_case['test_name'],
+        "agent_response": agent_response,
+        "expected_response": test_case['expected_output'],
+        "passed": passed,
+        "execution_time_ms": execution_time_ms,
+        "error_message": error_message,
+        "metadata": {
+            'test_name': test_case['test_name'],
+            'comparison_type': test_case['expected_output_type']
+        }
+    }
+
+
 def run_benchmark_sync(category=None):
     """
     Synchronous benchmark execution with A2A protocol.
@@ -576,6 +821,7 @@ def run_benchmark_sync(category=None):
         Dictionary with benchmark results and metrics
     """
     # Load test cases
+    db = _db()
     test_cases = db.getBenchmarkTestCases(category=category, active_only=True)
 
     if not test_cases:
@@ -585,113 +831,43 @@ def run_benchmark_sync(category=None):
             "metrics": db.getBenchmarkMetrics(category=category)
         }
 
-    print(f"Loaded {len(test_cases)} test cases")
+    logger.info("Loaded %d test cases", len(test_cases))
 
-    # Run each test
-    results = []
-    for i, test_case in enumerate(test_cases, 1):
-        print(f"\n[{i}/{len(test_cases)}] Testing: {test_case['test_name']}")
-
-        # Prepare test parameters
-        test_id = test_case['test_id']
-        input_message = test_case['input_message']
-        page_context = test_case.get('page_context')
-
-        # Parse page_context if it's a JSON string
-        if page_context and isinstance(page_context, str):
-            try:
-                page_context = json.loads(page_context)
-            except json.JSONDecodeError:
-                page_context = None
-
-        # Send request via A2A
-        import time
-        start_time = time.time()
-
-        message_id = a2a_protocol.send_request(
-            sender="evaluation_agent",
-            recipient="chat_agent",
-            action="chat_request",
-            params={
-                "message": input_message,
-                "page_context": page_context
-            }
-        )
-
-        # Get response directly from LLM (simplified for synchronous version)
-        groq = GroqClient()
-
-        # Build system prompt
-        if page_context and page_context.get('content'):
-            clean_content = clean_html_content(page_context.get('content', ''))
-            system_prompt = f"""
-                You are a helpful AI assistant. You have access to the current page content that the user is viewing.
-                IMPORTANT INSTRUCTIONS:
-                1. If the user's question is related to the content on the current page, use that content to provide accurate and relevant answers.
-                2. Reference specific information from the page when it helps answer the user's question.
-                3. If the user asks about something not covered on the current page, provide general helpful information.
-                4. Be conversational and helpful while maintaining accuracy.
-
-                CURRENT PAGE CONTENT:
-                Title:   {page_context.get('title', 'Unknown page')}
-                URL:     {page_context.get('url', 'N/A')}
-                Content: {clean_content}
-
-                Use this content to provide contextually relevant responses when appropriate.
-            """
-        else:
-            system_prompt = "You are a helpful AI assistant."
-
-        ai_result = groq.send_message(
-            message=input_message,
-            conversation_history=[],
-            system_prompt=system_prompt
-        )
+    # Each test is dominated by a blocking LLM network call, so run them
+    # concurrently over a thread pool (the GIL is released during I/O).
+    # The shared client and evaluator are resolved once here because the
+    # worker threads have no app context.
+    groq = get_groq_client()
+    evaluator = _evaluation_agent()
+    with ThreadPoolExecutor(max_workers=min(16, len(test_cases))) as pool:
+        outcomes = list(pool.map(
+            lambda tc: _run_one_benchmark_test(tc, groq, evaluator),
+            test_cases
+        ))
 
-        agent_response = ai_result.get('response', 'Error processing request')
-        execution_time_ms = int((time.time() - start_time) * 1000)
+    # Store all results in one transaction instead of one INSERT per test
+    db.storeBenchmarkResultsBatch(outcomes)
 
-        # Evaluate response
-        passed, error_message = evaluation_agent.evaluate_response(
-            actual_response=agent_response,
-            expected_response=test_case['expected_output'],
-            comparison_type=test_case['expected_output_type']
-        )
-
-        # Store result
-        result_id = db.storeBenchmarkResult(
-            test_id=test_id,
-            agent_response=agent_response,
-            expected_response=test_case['expected_output'],
-            passed=passed,
-            execution_time_ms=execution_time_ms,
-            error_message=error_message,
-            metadata={
-                'test_name': test_case['test_name'],
-                'comparison_type': test_case['expected_output_type']
-            }
-        )
-
-        status = "[PASS]" if passed else "[FAIL]"
-        print(f"    Result: {status} ({execution_time_ms}ms)")
-        if error_message:
-            print(f"    Error: {error_message}")
+    results = []
+    for i, outcome in enumerate(outcomes, 1):
+        status = "[PASS]" if outcome['passed'] else "[FAIL]"
+        logger.debug("[%d/%d] %s: %s (%dms)", i, len(outcomes),
+                     outcome['test_name'], status, outcome['execution_time_ms'])
+        if outcome['error_message']:
+            logger.debug("    Error: %s", outcome['error_message'])
 
         results.append({
-            "test_id": test_id,
-            "test_name": test_case['test_name'],
-            "passed": passed,
-            "execution_time_ms": execution_time_ms,
-            "error_message": error_message
+            "test_id": outcome['test_id'],
+            "test_name": outcome['test_name'],
+            "passed": outcome['passed'],
+            "execution_time_ms": outcome['execution_time_ms'],
+            "error_message": outcome['error_message']
         })
 
     # Get final metrics
-    metrics = db.getBenchmarkMetrics(category=category)
+    metrics = _db().getBenchmarkMetrics(category=category)
 
-    print(f"\n{'='*60}")
-    print(f"Benchmark Complete")
-    print(f"Success Rate: {metrics['success_rate']}%")
-    print(f"{'='*60}\n")
+    logger.info("Benchmark complete - success rate: %s%%", metrics['success_rate'])
 
     return {
         "success": True,
@@ -714,7 +890,7 @@ def get_benchmark_metrics():
     """
     try:
         category = request.args.get('category')
-        metrics = db.getBenchmarkMetrics(category=category)
+        metrics = _db().getBenchmarkMetrics(category=category)
         return jsonify({"success": True, "metrics": metrics})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -733,7 +909,7 @@ def get_benchmark_results():
     """
     try:
         limit = int(request.args.get('limit', 20))
-        results = db.getRecentBenchmarkResults(limit=limit)
+        results = _db().getRecentBenchmarkResults(limit=limit)
         return jsonify({"success": True, "results": results})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -754,7 +930,7 @@ def get_test_cases():
     try:
         category = request.args.get('category')
         active_only = request.args.get('active_only', 'true').lower() == 'true'
-        test_cases = db.getBenchmarkTestCases(category=category, active_only=active_only)
+        test_cases = _db().getBenchmarkTestCases(category=category, active_only=active_only)
         return jsonify({"success": True, "test_cases": test_cases})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -857,24 +1033,44 @@ def log_network_request():
 # HEALTH CHECK ENDPOINT
 #==================================================
 
+# Health probes arrive every few seconds per replica; caching the DB ping
+# for a short window turns most probes into a dict lookup instead of a
+# round-trip. The lock keeps concurrent probes from refreshing in parallel.
+_HEALTH_TTL_SECONDS = 2.0
+_health_lock = threading.Lock()
+_health_state = {'ok': False, 'error': None, 'checked_at': 0.0}
+
+def _cached_health():
+    """Return (ok, error), re-running the DB ping at most once per TTL."""
+    now = time.monotonic()
+    if now - _health_state['checked_at'] < _HEALTH_TTL_SECONDS:
+        return _health_state['ok'], _health_state['error']
+    with _health_lock:
+        # Re-check under the lock - another probe may have just refreshed
+        now = time.monotonic()
+        if now - _health_state['checked_at'] < _HEALTH_TTL_SECONDS:
+            return _health_state['ok'], _health_state['error']
+        try:
+            _db().query("SELECT 1")
+            _health_state.update(ok=True, error=None, checked_at=now)
+        except Exception as e:
+            _health_state.update(ok=False, error=str(e), checked_at=now)
+    return _health_state['ok'], _health_state['error']
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """
     Health check endpoint for testing if Flask app is running.
-    Tests database connection and returns status.
+    Tests database connection (cached for a short TTL) and returns status.
     """
-    from .utils.database import database
-    try:
-        # Test database connection
-        db = database()
-        db.query("SELECT 1")
+    ok, error = _cached_health()
+    if ok:
         return jsonify({
             "status": "healthy",
             "flask_app": "running",
             "database": "connected"
         }), 200
-    except Exception as e:
-        return jsonify({
-            "status": "unhealthy",
-            "error": str(e)
-        }), 500
+    return jsonify({
+        "status": "unhealthy",
+        "error": error
+    }), 500
@@ -7,14 +7,36 @@
 # - Request/response lifecycle management
 # - Message tracking and history for debugging
 
-import uuid
+import itertools
+import json
+import secrets
+import time
+from collections import deque
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import datetime, timezone
+
+# Encode messages with orjson's C serializer when it is installed - it
+# writes bytes directly, skipping stdlib json's str intermediary. Falls
+# back to the stdlib encoder otherwise.
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
 
 #==================================================
 # A2A MESSAGE CLASS
 #==================================================
 
+def _new_message_id() -> str:
+    """Generate a time-ordered (ULID-style) message id: 12 hex digits of
+    millisecond timestamp followed by 16 hex digits of randomness."""
+    return f"{int(time.time() * 1000):012x}{secrets.token_hex(8)}"
+
+
 class A2AMessage:
     """
     Represents a message in the Agent-to-Agent protocol.
@@ -23,6 +45,10 @@ class A2AMessage:
     an action to perform, and parameters for that action.
     """
 
+    # Thousands of messages are retained in the protocol history; slots
+    # drop the per-instance __dict__ and speed up attribute access
+    __slots__ = ('message_id', 'sender', 'recipient', 'action', 'params', 'timestamp')
+
     def __init__(self, sender: str, recipient: str, action: str, params: Dict[str, Any]):
         """
         Initialize an A2A message.
@@ -33,12 +59,24 @@ class A2AMessage:
             action: The action to perform (e.g., "chat_request", "evaluate", "response")
             params: Dictionary of parameters for the action
         """
-        self.message_id = str(uuid.uuid4())
+        # ULID-style id: millisecond timestamp prefix + random suffix. Ids
+        # sort by creation time, so stale pending requests can be evicted
+        # with a simple prefix comparison instead of checking every
+        # message's timestamp. Cheaper than uuid4 (no UUID object wrapping),
+        # and the timestamp stays a float until serialization.
+        self.message_id = _new_message_id()
         self.sender = sender
         self.recipient = recipient
         self.action = action
         self.params = params
-        self.timestamp = datetime.utcnow().isoformat()
+        self.timestamp = time.time()
+
+    def _timestamp_iso(self) -> str:
+        """Render the timestamp as an ISO string (deserialized messages
+        may already carry one)."""
+        if isinstance(self.timestamp, str):
+            return self.timestamp
+        return datetime.fromtimestamp(self.timestamp, tz=timezone.utc).replace(tzinfo=None).isoformat()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert message to dictionary for JSON serialization."""
@@ -48,22 +86,31 @@ class A2AMessage:
             'recipient': self.recipient,
             'action': self.action,
             'params': self.params,
-            'timestamp': self.timestamp
+            'timestamp': self._timestamp_iso()
         }
 
+    def to_json(self) -> bytes:
+        """Serialize the message to JSON bytes for wire transport.
+
+        In-process dispatch passes params by reference and never
+        serializes; this is for callers shipping messages over HTTP or a
+        queue, where orjson (when installed) encodes large page_context
+        dicts several times faster than stdlib json.
+        """
+        return _json_dumps(self.to_dict())
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'A2AMessage':
         """Create message from dictionary."""
-        msg = cls(
-            sender=data['sender'],
-            recipient=data['recipient'],
-            action=data['action'],
-            params=data['params']
-        )
-        if 'message_id' in data:
-            msg.message_id = data['message_id']
-        if 'timestamp' in data:
-            msg.timestamp = data['timestamp']
+        # Bypass __init__ so we don't generate an id/timestamp only to
+        # overwrite them with the transported values
+        msg = object.__new__(cls)
+        msg.sender = data['sender']
+        msg.recipient = data['recipient']
+        msg.action = data['action']
+        msg.params = data['params']
+        msg.message_id = data.get('message_id') or _new_message_id()
+        msg.timestamp = data.get('timestamp', time.time())
         return msg
 
 
@@ -71,6 +118,11 @@ class A2AMessage:
 # A2A PROTOCOL CLASS
 #==================================================
 
+# Maximum messages retained for debugging; older ones are discarded so the
+# history cannot grow without bound under benchmark or production load
+MESSAGE_HISTORY_MAXLEN = 10_000
+
+
 class A2AProtocol:
     """
     Manages Agent-to-Agent protocol communication.
@@ -82,7 +134,9 @@ class A2AProtocol:
     def __init__(self):
         """Initialize the A2A protocol handler."""
         self.pending_requests = {}  # message_id -> A2AMessage
-        self.message_history = []   # List of all messages for debugging
+        # Ring buffer of recent messages for debugging - deque(maxlen=...)
+        # drops the oldest entry in O(1) once the cap is reached
+        self.message_history = deque(maxlen=MESSAGE_HISTORY_MAXLEN)
 
     def send_request(
         self,
@@ -168,6 +222,26 @@ class A2AProtocol:
         """
         return self.pending_requests.get(message_id)
 
+    def evict_pending(self, max_age_seconds: float = 300.0) -> int:
+        """
+        Drop pending requests older than max_age_seconds.
+
+        The ULID-style ids sort by creation time, so an id-prefix
+        comparison against a cutoff id finds stale entries without reading
+        each message's timestamp.
+
+        Args:
+            max_age_seconds: Age threshold beyond which a request is stale
+
+        Returns:
+            Number of requests evicted
+        """
+        cutoff = f"{int((time.time() - max_age_seconds) * 1000):012x}"
+        stale = [mid for mid in self.pending_requests if mid[:12] < cutoff]
+        for mid in stale:
+            del self.pending_requests[mid]
+        return len(stale)
+
     def get_message_history(self, limit: int = 100) -> list:
         """
         Get recent message history for debugging.
@@ -178,11 +252,12 @@ class A2AProtocol:
         Returns:
             List of recent A2AMessage objects
         """
-        return self.message_history[-limit:]
+        start = max(0, len(self.message_history) - limit)
+        return list(itertools.islice(self.message_history, start, None))
 
     def clear_history(self):
         """Clear message history (useful for testing)."""
-        self.message_history = []
+        self.message_history.clear()
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -18,8 +18,10 @@ from io import StringIO
 import itertools
 import hashlib
 import os
+import random
 import cryptography
 from cryptography.fernet import Fernet
+from functools import lru_cache
 from math import pow
 from flask import current_app
 try:
@@ -28,6 +30,31 @@ try:
 except ImportError:
     EMBEDDING_AVAILABLE = False
 
+# Decode stored JSON columns with orjson's C parser when it is installed
+try:
+    import orjson
+
+    def _json_loads(s):
+        return orjson.loads(s)
+except ImportError:
+    _json_loads = json.loads
+
+#==================================================
+# ENCRYPTION HELPERS
+#==================================================
+
+@lru_cache(maxsize=2048)
+def _derive_scrypt(password, salt, n, r, p):
+    """
+    Derive (and memoize) the scrypt hash for a password.
+
+    scrypt is deliberately compute- and memory-hard, so repeated logins
+    with the same credentials would otherwise burn the full derivation
+    cost every time. Module-level so the cache is shared across database
+    instances within a worker process.
+    """
+    return hashlib.scrypt(password, salt=salt, n=n, r=r, p=p).hex()
+
 #==================================================
 # DATABASE CLASS
 #==================================================
@@ -58,7 +85,7 @@ class database:
         self.password   = current_app.config.get('DATABASE_PASSWORD')
         
         # Tables must be created in order due to foreign key constraints
-        self.tables = ['institutions', 'positions', 'experiences', 'skills', 'users', 'documents', 'llm_roles', 'benchmark_test_cases', 'benchmark_results']
+        self.tables = ['institutions', 'positions', 'experiences', 'skills', 'users', 'documents', 'llm_roles', 'benchmark_test_cases', 'benchmark_results', 'llm_cache']
 
         # Encryption configuration
         self.encryption = {
@@ -71,6 +98,10 @@ class database:
             'reversible': { 'key': current_app.config.get('ENCRYPTION_REVERSIBLE_KEY')}
         }
 
+        # Build the Fernet once - constructing it per call repeats the
+        # OpenSSL key schedule for every encrypt/decrypt
+        self._fernet = Fernet(self.encryption['reversible']['key'])
+
     #--------------------------------------------------
     # DATABASE QUERY FUNCTION
     #--------------------------------------------------
@@ -383,20 +414,17 @@ class database:
     # ENCRYPTION FUNCTIONS
     #--------------------------------------------------
     def onewayEncrypt(self, string):
-        encrypted_string = hashlib.scrypt(string.encode('utf-8'),
-                                          salt = self.encryption['oneway']['salt'],
-                                          n    = self.encryption['oneway']['n'],
-                                          r    = self.encryption['oneway']['r'],
-                                          p    = self.encryption['oneway']['p']
-                                          ).hex()
-        return encrypted_string
+        return _derive_scrypt(string.encode('utf-8'),
+                              self.encryption['oneway']['salt'],
+                              self.encryption['oneway']['n'],
+                              self.encryption['oneway']['r'],
+                              self.encryption['oneway']['p'])
 
     def reversibleEncrypt(self, type, message):
-        fernet = Fernet(self.encryption['reversible']['key'])
         if type == 'encrypt':
-            message = fernet.encrypt(message.encode())
+            message = self._fernet.encrypt(message.encode())
         elif type == 'decrypt':
-            message = fernet.decrypt(message).decode()
+            message = self._fernet.decrypt(message).decode()
 
         return message
 
@@ -426,7 +454,89 @@ class database:
 
         query += " ORDER BY test_id"
 
-        return self.query(query, tuple(params) if params else None)
+        rows = self.query(query, tuple(params) if params else None)
+        for row in rows:
+            self._decodePageContext(row)
+        return rows
+
+    @staticmethod
+    def _decodePageContext(row):
+        """
+        Decode a stringified page_context column in place.
+
+        Done once as rows leave the DB layer so consumers read a dict
+        directly instead of type-checking and parsing per use.
+        """
+        page_context = row.get('page_context')
+        if page_context and isinstance(page_context, str):
+            try:
+                row['page_context'] = _json_loads(page_context)
+            except ValueError:
+                row['page_context'] = None
+        return row
+
+    @staticmethod
+    def _benchmarkTestCaseFilter(category=None, active_only=True):
+        """Build the shared WHERE clause and params for test-case queries."""
+        where = " WHERE 1=1"
+        params = []
+        if category:
+            where += " AND test_category = %s"
+            params.append(category)
+        if active_only:
+            where += " AND active = TRUE"
+        return where, params
+
+    def countBenchmarkTestCases(self, category=None, active_only=True):
+        """
+        Count benchmark test cases matching the filters.
+
+        Cheap aggregate used for progress totals when streaming test
+        cases instead of materializing them.
+
+        Returns:
+            Number of matching test cases
+        """
+        where, params = self._benchmarkTestCaseFilter(category, active_only)
+        result = self.query("SELECT COUNT(*) AS n FROM benchmark_test_cases" + where,
+                            tuple(params) if params else None)
+        return result[0]['n'] if result else 0
+
+    def iterBenchmarkTestCases(self, category=None, active_only=True, itersize=100):
+        """
+        Stream benchmark test cases via a server-side cursor.
+
+        Rows are fetched in batches of itersize as the caller iterates,
+        so execution can begin before the full suite is transferred and
+        peak memory stays bounded regardless of suite size.
+
+        Args:
+            category: Filter by test category (optional)
+            active_only: Only return active tests (default True)
+            itersize: Server-side fetch batch size
+
+        Yields:
+            Test case dictionaries in test_id order
+        """
+        where, params = self._benchmarkTestCaseFilter(category, active_only)
+        query = "SELECT * FROM benchmark_test_cases" + where + " ORDER BY test_id"
+
+        cnx = psycopg2.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port,
+            database=self.database
+        )
+        try:
+            with cnx.cursor(name='benchmark_test_cases_iter',
+                            cursor_factory=psycopg2.extras.RealDictCursor) as cur:
+                cur.itersize = itersize
+                cur.execute(query, tuple(params) if params else None)
+                for row in cur:
+                    yield self._decodePageContext(row)
+        finally:
+            cnx.close()
 
     def storeBenchmarkResult(self, test_id, agent_response, expected_response,
                              passed, execution_time_ms=None, error_message=None,
@@ -469,6 +579,61 @@ class database:
 
         return result[0]['result_id'] if result else None
 
+    def storeBenchmarkResultsBatch(self, results):
+        """
+        Store many benchmark results in a single transaction.
+
+        One multi-row INSERT replaces N round-trips and N commits when a
+        whole benchmark run finishes at once.
+
+        Args:
+            results: List of dicts with the same fields storeBenchmarkResult
+                     accepts (test_id, agent_response, expected_response,
+                     passed, execution_time_ms, error_message, metadata)
+
+        Returns:
+            Number of rows inserted
+        """
+        if not results:
+            return 0
+
+        rows = [(
+            r['test_id'],
+            r['agent_response'],
+            r['expected_response'],
+            r['passed'],
+            r.get('execution_time_ms'),
+            r.get('error_message'),
+            json.dumps(r['metadata']) if r.get('metadata') else None
+        ) for r in results]
+
+        cnx = psycopg2.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            port=self.port,
+            database=self.database
+        )
+        try:
+            with cnx, cnx.cursor() as cur:
+                # Benchmark results are reproducible telemetry, so don't
+                # make the commit wait for WAL flush to disk - the Postgres
+                # analogue of SQLite's synchronous=NORMAL. Worst case a
+                # crash loses the last few results; it cannot corrupt data.
+                cur.execute("SET LOCAL synchronous_commit TO OFF")
+                psycopg2.extras.execute_values(
+                    cur,
+                    """INSERT INTO benchmark_results
+                       (test_id, agent_response, expected_response, passed,
+                        execution_time_ms, error_message, metadata)
+                       VALUES %s""",
+                    rows
+                )
+        finally:
+            cnx.close()
+
+        return len(rows)
+
     def getBenchmarkMetrics(self, category=None, limit_results=100):
         """
         Get aggregated benchmark metrics.
@@ -627,6 +792,91 @@ class database:
             print(f"Error in semantic_search: {e}")
             return []
 
+    #--------------------------------------------------
+    # SEMANTIC LLM RESPONSE CACHE
+    #--------------------------------------------------
+    def searchLLMCache(self, query_embedding: list, namespace: str, threshold: float = 0.92):
+        """
+        Look up a cached LLM response semantically similar to the query.
+
+        Finds the nearest cached entry in the same namespace by cosine
+        similarity and returns its stored response when similarity meets
+        the threshold, so paraphrases of an answered question skip the
+        LLM round-trip.
+
+        Args:
+            query_embedding: 768-dimensional embedding of the message
+            namespace: Cache partition (expert role or prompt digest)
+            threshold: Minimum cosine similarity for a hit (default: 0.92)
+
+        Returns:
+            The cached response dict, or None on miss.
+        """
+        if not query_embedding:
+            return None
+
+        embedding_str = f"'[{','.join(map(str, query_embedding))}]'"
+        sql = f"""
+            SELECT response, 1 - (embedding <=> {embedding_str}) as similarity
+            FROM llm_cache
+            WHERE namespace = %s AND embedding IS NOT NULL
+            ORDER BY embedding <=> {embedding_str}
+            LIMIT 1
+        """
+
+        try:
+            rows = self.query(sql, [namespace])
+            if rows and rows[0].get('similarity', 0) >= threshold:
+                response = rows[0]['response']
+                if isinstance(response, str):
+                    response = _json_loads(response)
+                return response
+        except Exception as e:
+            print(f"Error in searchLLMCache: {e}")
+        return None
+
+    def storeLLMCache(self, namespace: str, message: str, response: dict, embedding: list):
+        """
+        Store a completed LLM response in the semantic cache.
+
+        Args:
+            namespace: Cache partition (expert role or prompt digest)
+            message: Original message text, kept for inspection
+            response: Full send_message result dict
+            embedding: 768-dimensional embedding of the message
+        """
+        if not embedding:
+            return
+        try:
+            self.insertRows(
+                table='llm_cache',
+                columns=['namespace', 'message', 'response', 'embedding'],
+                parameters=[[namespace, message, json.dumps(response),
+                             f"[{','.join(map(str, embedding))}]"]]
+            )
+            # Opportunistic eviction: roughly one store in 256 sweeps out
+            # entries older than 24h, so the table (and its ivfflat index)
+            # stays bounded without a separate scheduler.
+            if random.random() < 1.0 / 256:
+                self.evictLLMCache(max_age_hours=24)
+        except Exception as e:
+            print(f"Error in storeLLMCache: {e}")
+
+    def evictLLMCache(self, max_age_hours: int = 24) -> None:
+        """
+        Delete cached responses older than max_age_hours.
+
+        Args:
+            max_age_hours: Age threshold beyond which entries are dropped
+        """
+        try:
+            self.query(
+                "DELETE FROM llm_cache WHERE created_at < CURRENT_TIMESTAMP - %s * INTERVAL '1 hour'",
+                [max_age_hours]
+            )
+        except Exception as e:
+            print(f"Error in evictLLMCache: {e}")
+
     #--------------------------------------------------
     # LLM ROLE FUNCTIONS
     #--------------------------------------------------
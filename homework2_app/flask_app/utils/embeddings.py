@@ -8,6 +8,7 @@
 import os
 import time
 import random
+from functools import lru_cache
 import google.generativeai as genai
 
 #==================================================
@@ -137,6 +138,53 @@ def generate_query_embedding(text: str, max_retries: int = 3) -> list:
     return None
 
 
+#==================================================
+# QUERY EMBEDDING CACHE
+#==================================================
+
+class _EmbeddingUnavailable(Exception):
+    """Raised internally so failed lookups are never cached."""
+
+
+@lru_cache(maxsize=1024)
+def _cached_query_embedding(text: str) -> tuple:
+    """Memoized core of cached_query_embedding.
+
+    Returns the vector as a tuple because lru_cache entries must be
+    immutable - a caller mutating a cached list would corrupt every
+    later hit. Raises instead of returning None on failure, since
+    lru_cache does not cache exceptions and a transient API error must
+    not poison the cache for that query.
+    """
+    embedding = generate_query_embedding(text)
+    if embedding is None:
+        raise _EmbeddingUnavailable(text)
+    return tuple(embedding)
+
+
+def cached_query_embedding(text: str) -> list:
+    """
+    Generate a query embedding, serving repeats from an in-process cache.
+
+    Users re-issue the same searches (and the ReAct loop re-embeds
+    identical queries across iterations); a hit skips the Gemini API
+    round-trip entirely. Same contract as generate_query_embedding:
+    a list of 768 floats, or None on failure.
+
+    Args:
+        text: Query text to embed
+
+    Returns:
+        List of 768 floats, or None if embedding failed.
+    """
+    if not text or not text.strip():
+        return generate_query_embedding(text)
+    try:
+        return list(_cached_query_embedding(text))
+    except _EmbeddingUnavailable:
+        return None
+
+
 #==================================================
 # SIMILARITY CALCULATION
 #==================================================
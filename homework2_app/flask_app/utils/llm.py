@@ -8,20 +8,41 @@
 # - Orchestrator for coordinating multiple experts
 # - Risk assessment for dangerous operations
 
+import hashlib
 import os
+import threading
 import time
 import logging
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
-from flask import current_app, session, jsonify
+from flask import current_app, session, jsonify, has_request_context, copy_current_request_context
 from flask_app import socketio
-from .socket_events import process_and_emit_message
+from .socket_events import process_and_emit_message, process_and_emit_stream
 from .a2a_protocol import A2AProtocol, A2AMessage
+from .database import database
+from .embeddings import cached_query_embedding
 from .web_crawler import WebCrawlerAgent
 from groq import Groq
 import ast
 import re
 import json
 
+# sqlglot validates expert-generated SQL with a real parser before it
+# reaches the database; optional, the regex extractor works without it
+try:
+    import sqlglot
+except ImportError:
+    sqlglot = None
+
+# orjson's C serializer renders the expert-results blob for the synthesis
+# prompt several times faster than stdlib json; optional like elsewhere
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
@@ -154,10 +175,84 @@ All tables have 768-dim embedding columns. Use <=> operator for cosine distance.
 }
 
 
+def _precompile_role_prefixes(roles: Dict[str, dict]) -> Dict[str, dict]:
+    """Precompute the static prompt prefix for each role configuration.
+
+    Everything in a role prompt except the user's request is fixed per
+    role, so the role/domain line, instructions, context, and examples are
+    joined once here and stored under '_prefix'. Building a role prompt is
+    then a single concatenation instead of re-assembling several KB of
+    static text on every call. Run at import for the defaults and again
+    whenever roles are reloaded from the database.
+    """
+    for role_config in roles.values():
+        prompt_parts = [f"You are a {role_config['role']} with expertise in {role_config['domain']}."]
+        if role_config.get('specific_instructions'):
+            prompt_parts.append(f"\nInstructions:\n{role_config['specific_instructions']}")
+        if role_config.get('background_context'):
+            prompt_parts.append(f"\nContext:\n{role_config['background_context']}")
+        if role_config.get('few_shot_examples'):
+            prompt_parts.append(f"\nExamples:\n{role_config['few_shot_examples']}")
+        role_config['_prefix'] = '\n'.join(prompt_parts) + '\n\nRequest:\n'
+    return roles
+
+
+_precompile_role_prefixes(LLM_ROLES)
+
+
 #==================================================
 # GROQ LLM CLIENT
 #==================================================
 
+# Long-lived worker pool for blocking LLM calls dispatched off the calling
+# thread (orchestrator fan-out, background callers). LLM requests are pure
+# network I/O, so the pool can be sized well past the CPU count; a shared
+# pool also avoids spawning and tearing down threads per orchestrator plan.
+_LLM_EXECUTOR = ThreadPoolExecutor(
+    max_workers=int(os.getenv('LLM_WORKERS', 32)),
+    thread_name_prefix='llm'
+)
+
+# In-process LRU cache of successful completions, keyed by a digest of the
+# full request (model, sampling params, messages). A hit replaces a
+# multi-hundred-millisecond HTTPS round-trip with a dict lookup - the ReAct
+# loop in particular can re-issue byte-identical prompts when the model
+# reasons in circles. Size is env-tunable; 0 disables caching.
+_RESPONSE_CACHE_MAX = int(os.getenv('GROQ_CACHE_SIZE', 256))
+_RESPONSE_CACHE = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Semantic cache: pgvector-backed lookup that serves paraphrases of
+# already-answered questions (similarity above the threshold) without an
+# LLM round-trip. Only role-scoped expert calls participate - ReAct
+# prompts embed the full observation history and are never semantically
+# comparable across queries.
+_SEMANTIC_CACHE_ENABLED = os.getenv('GROQ_SEMANTIC_CACHE', '1').lower() not in ('0', 'false')
+_SEMANTIC_CACHE_THRESHOLD = float(os.getenv('GROQ_SEMANTIC_CACHE_THRESHOLD', 0.92))
+
+
+def _response_cache_key(model, temperature, max_tokens, messages):
+    """Digest the request parameters into a fixed-size cache key."""
+    payload = json.dumps([model, temperature, max_tokens, messages],
+                         sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).digest()
+
+
+def _response_cache_get(key):
+    with _RESPONSE_CACHE_LOCK:
+        result = _RESPONSE_CACHE.get(key)
+        if result is not None:
+            _RESPONSE_CACHE.move_to_end(key)
+        return result
+
+
+def _response_cache_put(key, value):
+    with _RESPONSE_CACHE_LOCK:
+        _RESPONSE_CACHE[key] = value
+        if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_MAX:
+            _RESPONSE_CACHE.popitem(last=False)
+
+
 class GroqClient:
     """Client for interacting with Groq API with role-based expert support"""
 
@@ -184,6 +279,10 @@ class GroqClient:
         self.max_tokens = max_tokens or int(os.getenv('GROQ_MAX_TOKENS', 4000))
         self.temperature = temperature or float(os.getenv('GROQ_TEMPERATURE', 0.7))
 
+        # Async client for callers batching calls with asyncio.gather;
+        # created lazily since most paths never need it
+        self._async_client = None
+
     def _build_prompt_from_template(self, role_config: dict, request: str) -> str:
         """Build parameterized prompt from role configuration.
 
@@ -194,65 +293,86 @@ class GroqClient:
         Returns:
             Formatted prompt string with role context
         """
-        prompt_parts = []
-
-        # Add role and domain
-        prompt_parts.append(f"You are a {role_config['role']} with expertise in {role_config['domain']}.")
-
-        # Add instructions if available
-        if role_config.get('specific_instructions'):
-            prompt_parts.append(f"\nInstructions:\n{role_config['specific_instructions']}")
-
-        # Add context if available
-        if role_config.get('background_context'):
-            prompt_parts.append(f"\nContext:\n{role_config['background_context']}")
-
-        # Add examples if available
-        if role_config.get('few_shot_examples'):
-            prompt_parts.append(f"\nExamples:\n{role_config['few_shot_examples']}")
-
-        # Add request
-        prompt_parts.append(f"\nRequest:\n{request}")
+        prefix = role_config.get('_prefix')
+        if prefix is None:
+            # Config that bypassed _precompile_role_prefixes; build and
+            # store its prefix on first use
+            prefix = _precompile_role_prefixes({'_': role_config})['_']['_prefix']
+        return prefix + request
+
+    def _build_messages(self, message: str, conversation_history: Optional[List[Dict]],
+                        system_prompt: Optional[str], role: Optional[str]) -> List[Dict]:
+        """Assemble the Groq messages list shared by the sync and async paths."""
+        messages = []
+
+        # Role-based prompt generation
+        if role and role in LLM_ROLES:
+            role_config = LLM_ROLES[role]
+            system_prompt = self._build_prompt_from_template(role_config, message)
+
+        # Add system prompt if provided
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+
+        # Add conversation history. Turns this app stores are already in
+        # API shape, so reuse them as-is instead of re-building a dict per
+        # turn per request; only entries missing keys get normalized.
+        for msg in (conversation_history or []):
+            if "role" in msg and "content" in msg:
+                messages.append(msg)
+            else:
+                messages.append({
+                    "role": msg.get("role", "user"),
+                    "content": msg.get("content", "")
+                })
 
-        return '\n'.join(prompt_parts)
+        # Add current user message
+        messages.append({"role": "user", "content": message})
+        return messages
 
     def send_message(self, message: str, conversation_history: Optional[List[Dict]] = None,
-                    system_prompt: Optional[str] = None, role: Optional[str] = None) -> Dict:
+                    system_prompt: Optional[str] = None, role: Optional[str] = None,
+                    bypass_cache: bool = False) -> Dict:
         """Send a message to Groq and get a response
 
         Args:
             message: The user's message
             conversation_history: List of previous messages in conversation
             system_prompt: Custom system prompt to define AI behavior (optional)
+            role: Expert role whose prompt prefix to apply (optional)
+            bypass_cache: Skip the semantic cache for this call (used for
+                requests that must reach the model, e.g. write operations)
 
         Returns:
             Dictionary containing response and metadata
         """
-        if conversation_history is None:
-            conversation_history = []
-
         try:
-            # Build messages for Groq API
-            messages = []
-
-            # Role-based prompt generation
-            if role and role in LLM_ROLES:
-                role_config = LLM_ROLES[role]
-                system_prompt = self._build_prompt_from_template(role_config, message)
-
-            # Add system prompt if provided
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            # Add conversation history
-            for msg in conversation_history:
-                messages.append({
-                    "role": msg.get("role", "user"),
-                    "content": msg.get("content", "")
-                })
-
-            # Add current user message
-            messages.append({"role": "user", "content": message})
+            messages = self._build_messages(message, conversation_history, system_prompt, role)
+
+            # Serve repeated identical requests from the in-process cache
+            cache_key = None
+            if _RESPONSE_CACHE_MAX > 0:
+                cache_key = _response_cache_key(self.model_name, self.temperature,
+                                                self.max_tokens, messages)
+                cached = _response_cache_get(cache_key)
+                if cached is not None:
+                    logger.debug("Groq response served from in-process cache")
+                    return cached
+
+            # Semantic cache: paraphrases of answered questions hit here.
+            # Namespaced by role so one expert's output is never served to
+            # another; write-risk messages always reach the model.
+            sem_embedding = None
+            if (_SEMANTIC_CACHE_ENABLED and role and not bypass_cache
+                    and not conversation_history
+                    and assess_message_risk(message)['risk_level'] == 'low'):
+                sem_embedding = cached_query_embedding(message)
+                if sem_embedding:
+                    cached = database().searchLLMCache(
+                        sem_embedding, role, _SEMANTIC_CACHE_THRESHOLD)
+                    if cached is not None:
+                        logger.debug("Groq response served from semantic cache")
+                        return cached
 
             logger.debug(f"Sending to Groq API (model: {self.model_name}, temp: {self.temperature})")
             logger.debug(f"Message count: {len(messages)} (role: {role})")
@@ -274,12 +394,17 @@ class GroqClient:
             logger.info(f"Groq API response received (tokens: {usage.get('total_tokens', 'N/A')}, time: {elapsed_time:.2f}s)")
             logger.debug(f"Response preview: {assistant_message[:100]}...")
 
-            return {
+            result = {
                 "success": True,
                 "response": assistant_message,
                 "usage": usage,
                 "model": self.model_name
             }
+            if cache_key is not None:
+                _response_cache_put(cache_key, result)
+            if sem_embedding:
+                database().storeLLMCache(role, message, result, sem_embedding)
+            return result
 
         except Exception as e:
             # Log the full error for debugging
@@ -293,13 +418,99 @@ class GroqClient:
                 "response": "I'm sorry, I'm having trouble right now. Please try again later."
             }
 
+    def send_message_stream(self, message: str, conversation_history: Optional[List[Dict]] = None,
+                            system_prompt: Optional[str] = None, role: Optional[str] = None):
+        """Stream a response from Groq token-by-token.
+
+        Yields content deltas (strings) as they arrive instead of buffering
+        the full completion, so callers can forward tokens to the client
+        incrementally (e.g. over SSE). Uses the SDK's native stream=True,
+        which reads the chunked HTTP response lazily.
+
+        Yields:
+            str: The next chunk of assistant text
+        """
+        messages = self._build_messages(message, conversation_history, system_prompt, role)
+
+        logger.debug(f"Streaming from Groq API (model: {self.model_name}, temp: {self.temperature})")
+
+        stream = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=messages,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True
+        )
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
+    async def send_message_async(self, message: str, conversation_history: Optional[List[Dict]] = None,
+                                 system_prompt: Optional[str] = None, role: Optional[str] = None) -> Dict:
+        """Async variant of send_message for batching many calls with asyncio.gather.
+
+        Uses the SDK's AsyncGroq client (created lazily on first use) so
+        dozens of LLM calls can be in flight on a single event loop.
+        Returns the same result dictionary shape as send_message.
+        """
+        from groq import AsyncGroq
+
+        if self._async_client is None:
+            self._async_client = AsyncGroq(api_key=self.api_key)
+
+        try:
+            messages = self._build_messages(message, conversation_history, system_prompt, role)
+
+            start_time = time.time()
+            response = await self._async_client.chat.completions.create(
+                model=self.model_name,
+                messages=messages,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens
+            )
+            elapsed_time = time.time() - start_time
+
+            assistant_message = response.choices[0].message.content
+            usage = response.usage.model_dump() if hasattr(response, 'usage') else {}
+            logger.info(f"Groq API response received (tokens: {usage.get('total_tokens', 'N/A')}, time: {elapsed_time:.2f}s)")
+
+            return {
+                "success": True,
+                "response": assistant_message,
+                "usage": usage,
+                "model": self.model_name
+            }
+
+        except Exception as e:
+            logger.error(f"[GroqClient Error] {str(e)}")
+
+            return {
+                "success": False,
+                "error": f"Groq API error: {str(e)}",
+                "response": "I'm sorry, I'm having trouble right now. Please try again later."
+            }
+
+
+@lru_cache(maxsize=1)
+def get_groq_client() -> GroqClient:
+    """
+    Return the process-wide GroqClient, constructed on first use.
+
+    The Groq SDK keeps a pooled HTTPS session internally; reconstructing
+    the client per request threw that connection (and its TLS handshake)
+    away every time.
+    """
+    return GroqClient()
+
 
 #==================================================
 # CHAT HANDLER FUNCTIONS
 #==================================================
 
 def handle_ai_chat_request(llm_client: GroqClient, message: str, system_prompt: str = None,
-                         room: str = 'main', page_content: dict = None, role: str = None, emit_to_socket: bool = True):
+                         room: str = 'main', page_content: dict = None, role: str = None, emit_to_socket: bool = True,
+                         stream: bool = False):
     """
     Handle AI chat requests with LLM and broadcast responses via SocketIO.
 
@@ -311,6 +522,10 @@ def handle_ai_chat_request(llm_client: GroqClient, message: str, system_prompt:
         page_content: Dictionary containing page content information (optional)
         role: Expert role to use (Database Read Expert, Database Write Expert, etc.)
         emit_to_socket: Whether to emit the response to Socket.IO (default: True, set False for nested calls)
+        stream: Stream the response to the socket token-by-token instead of
+            emitting one complete message. Multi-step flows (ReAct, the
+            orchestrator) must leave this off - they parse the full
+            response before anything reaches the user.
 
     Returns:
         Response: JSON response with LLM reply or error message
@@ -319,8 +534,11 @@ def handle_ai_chat_request(llm_client: GroqClient, message: str, system_prompt:
     logger.debug(f"User message: {message[:80]}...")
 
     try:
-        # Get conversation history from session if available
-        conversation_history = session.get('chat_history', [])
+        # Get conversation history from session if available. A bounded
+        # deque drops the oldest turns in O(1) on append, replacing the
+        # slice-copy trim that reallocated the list every request.
+        conversation_history = deque(session.get('chat_history', ()),
+                                     maxlen=_MAX_CONVERSATION_HISTORY)
         system_prompt = system_prompt or os.getenv('GROQ_SYSTEM_PROMPT', 'You are a helpful AI assistant.')
 
         # Add page content to context for Content Expert
@@ -330,21 +548,34 @@ def handle_ai_chat_request(llm_client: GroqClient, message: str, system_prompt:
         else:
             message_with_context = message
 
-        result = llm_client.send_message(message_with_context, conversation_history, system_prompt=system_prompt, role=role)
+        streamed = stream and emit_to_socket
+        if streamed:
+            # Forward deltas to the room as they arrive; the accumulated
+            # text feeds history and the JSON response as usual
+            chunks = llm_client.send_message_stream(
+                message_with_context, conversation_history, system_prompt=system_prompt, role=role)
+            full_response = process_and_emit_stream(socketio, chunks, 'ai', room)
+            result = {
+                "success": True,
+                "response": full_response,
+                "usage": {},
+                "model": llm_client.model_name
+            }
+        else:
+            result = llm_client.send_message(message_with_context, conversation_history, system_prompt=system_prompt, role=role)
 
         if result["success"]:
             logger.info(f"AI request successful (role: {role})")
 
-            # update conversation history
+            # update conversation history; maxlen enforces the cap, and the
+            # session gets a plain list back since it must stay serializable
             conversation_history.append({"role": "user", "content": message})
             conversation_history.append({"role": "assistant", "content": result["response"]})
-            max_history = int(os.getenv('GROQ_MAX_CONVERSATION_HISTORY', 1))
-            if len(conversation_history) > max_history:
-                conversation_history = conversation_history[-max_history:]
-            session['chat_history'] = conversation_history
+            session['chat_history'] = list(conversation_history)
 
-            # Use centralized message processing for AI responses (only if not a nested call)
-            if emit_to_socket:
+            # Use centralized message processing for AI responses (only if
+            # not a nested call and not already streamed chunk-by-chunk)
+            if emit_to_socket and not streamed:
                 process_and_emit_message(socketio, result["response"], 'ai', room)
 
         else:
@@ -366,124 +597,169 @@ def handle_ai_chat_request(llm_client: GroqClient, message: str, system_prompt:
 # RISK ASSESSMENT
 #==================================================
 
+# Keywords that flag a message as potentially destructive. Compiled into a
+# single case-insensitive alternation at import so risk assessment is one
+# pass over the message in C instead of a Python loop of substring scans.
+DANGEROUS_KEYWORDS = ['delete', 'remove', 'clear', 'drop', 'destroy', 'truncate']
+_DANGER_RE = re.compile(r'\b(?:' + '|'.join(map(re.escape, DANGEROUS_KEYWORDS)) + r')\b', re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
 def assess_message_risk(message: str) -> dict:
     """
     Assess if a message contains potentially dangerous operations.
 
+    Results are memoized - the ReAct loop and cache gates re-assess the
+    same message several times per request. Callers must treat the
+    returned dict as read-only.
+
     Args:
         message: User's message to assess
 
     Returns:
         dict with risk_level ('high', 'low') and explanation
     """
-    dangerous_keywords = ['delete', 'remove', 'clear', 'drop', 'destroy', 'truncate']
-    message_lower = message.lower()
-
-    found_keywords = [kw for kw in dangerous_keywords if kw in message_lower]
-
-    if found_keywords:
-        return {
-            'risk_level': 'high',
-            'explanation': f"This request contains potentially dangerous operations: {', '.join(found_keywords)}. This action may modify or delete data.",
-            'keywords_found': found_keywords
-        }
-    else:
+    # search() short-circuits on the first hit, so the common safe path is
+    # a single scan with no match-list allocation
+    if not _DANGER_RE.search(message):
         return {
             'risk_level': 'low',
             'explanation': 'This request appears safe to process.',
             'keywords_found': []
         }
 
+    found_keywords = sorted({m.lower() for m in _DANGER_RE.findall(message)},
+                            key=DANGEROUS_KEYWORDS.index)
+    return {
+        'risk_level': 'high',
+        'explanation': f"This request contains potentially dangerous operations: {', '.join(found_keywords)}. This action may modify or delete data.",
+        'keywords_found': found_keywords
+    }
+
 
 #==================================================
 # REACT PATTERN HANDLER
 #==================================================
 
-def handle_ai_chat_request_react(llm_client: GroqClient, message: str,
-                                 room: str = 'main', page_content: dict = None) -> dict:
-    """
-    ReAct pattern orchestrator for multi-step reasoning with semantic search.
-
-    This implements the ReAct (Reasoning + Acting) pattern where the LLM:
-    1. Thinks about what to do
-    2. Selects an action (tool)
-    3. Observes the result
-    4. Repeats until it can provide a Final Answer
-
-    Args:
-        llm_client: Groq LLM client
-        message: User's question
-        room: SocketIO room for emitting messages
-        page_content: Current page context (not used in current implementation)
-
-    Returns:
-        dict with success, response, and reasoning trace
+# Patterns used on every ReAct iteration / orchestrator call, compiled
+# once at import instead of per re.search invocation
+# Combined state classifier: one scan finds either a final-answer marker
+# (group 1) or an action directive (group 2) instead of separate substring
+# checks plus an action search over the same response
+_REACT_STATE_RE = re.compile(r'(Final Answer:|FINAL ANSWER:)|(?i:Action:\s*(\w+))')
+_INPUT_PATTERNS = [
+    re.compile(r'Action Input:\s*(.+?)(?:\nThought:|\nAction:|$)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'Action:\s*\w+\s*\[(.+?)\]', re.IGNORECASE | re.DOTALL),
+    re.compile(r'Action:\s*\w+\s*\((.+?)\)', re.IGNORECASE | re.DOTALL),
+    re.compile(r'Parameters:\s*\{(.+?)\}', re.IGNORECASE | re.DOTALL),  # Parameters: {key: value, ...}
+]
+_TEMPLATE_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        r'\[list of.*?\]',
+        r'\[.*?query results.*?\]',
+        r'\[.*?names.*?\]',
+        r'\[.*?companies.*?\]',
+        r'\[hyperlink\]',
+        r'\[.*?data.*?\]',
+        r'\[.*?institutions.*?\]',
+    )
+]
+_TABLE_RE = re.compile(r'table\s*[:=]\s*[\'"]?(\w+)[\'"]?', re.IGNORECASE)
+_QUERY_RE = re.compile(r'query\s*[:=]\s*[\'"]([^\'\"]+)[\'"]', re.IGNORECASE)
+_TABLE_DICT_RE = re.compile(r'[\'"]table[\'"]\s*:\s*[\'"]?(\w+)[\'"]?', re.IGNORECASE)
+_QUERY_DICT_RE = re.compile(r'[\'"]query[\'"]\s*:\s*[\'"]([^\'\"]+)[\'"]', re.IGNORECASE)
+_SQL_PREFIX_RE = re.compile(r'^sql\s*[:=]\s*', re.IGNORECASE)
+_URL_RE = re.compile(r'url\s*[:=]\s*[\'"]?([^\'"\\s]+)[\'"]?', re.IGNORECASE)
+_URL_DICT_RE = re.compile(r'[\'"]url[\'"]\s*:\s*[\'"]?([^\'"\\s]+)[\'"]?', re.IGNORECASE)
+_FUNC_CALL_RE = re.compile(r"handle_ai_chat_request\([^)]+\)")
+_ROLE_MSG_RE = re.compile(r"role=['\"]([^'\"]+)['\"],\s*message=['\"]([^'\"]+)['\"](?:[,)]|$)")
+
+def _extract_call_args(call_text: str):
+    """Parse a handle_ai_chat_request(...) call with the ast module.
+
+    A real parser handles nested quotes, commas inside the message, and
+    escaped characters that the regex extractor mangles. Returns
+    (role, message) when call_text is a well-formed call with string
+    keyword arguments, None otherwise (callers fall back to the regex).
     """
-    logger.info("="*60)
-    logger.info("handle_ai_chat_request_react (ReAct pattern)")
-    logger.debug(f"User question: {message[:80]}...")
-
-    MAX_ITERATIONS = 10
-    from .database import database
-    from .embeddings import generate_query_embedding
-
-    db = database()
-
-    # Tool execution functions
-    def execute_semantic_search(db, table, query):
-        """Execute semantic search using pgvector"""
-        try:
-            logger.info(f"[ReAct] Tool: semantic_search(table={table}, query={query[:50]}...)")
-            embedding = generate_query_embedding(query)
-            if not embedding:
-                logger.warning("[ReAct] Failed to generate query embedding")
-                return "Error: Failed to generate query embedding"
-            # Lower threshold from 0.3 to 0.2 for better abbreviation matching
-            results = db.semantic_search(table, embedding, limit=5, threshold=0.2)
-            logger.info(f"[ReAct] semantic_search returned {len(results)} results")
-            return json.dumps({"results": results, "count": len(results)})
-        except Exception as e:
-            logger.error(f"[ReAct] semantic_search error: {str(e)}")
-            return f"Error: {str(e)}"
-
-    def execute_sql_query(db, sql):
-        """Execute SQL query"""
-        try:
-            logger.info(f"[ReAct] Tool: sql_query(sql={sql[:80]}...)")
-            results = db.query(sql)
-            logger.info(f"[ReAct] sql_query returned {len(results)} results")
-            return json.dumps({"results": results, "count": len(results)})
-        except Exception as e:
-            logger.error(f"[ReAct] sql_query error: {str(e)}")
-            return f"Error: {str(e)}"
-
-    # ReAct tools available to the agent
-    REACT_TOOLS = {
-        "semantic_search": {
-            "description": "Search for semantically similar records using vector embeddings. Use when user uses abbreviations, synonyms, or concepts that may have different wording in the database.",
-            "parameters": "table (str: 'institutions', 'experiences', 'skills', 'positions', 'users', 'documents'), query (str: text to search for)",
-        },
-        "sql_query": {
-            "description": "Execute a SQL query on the database. Use for exact lookups when you know specific values.",
-            "parameters": "sql (str: valid SQL query)",
-        },
-        "crawl_web": {
-            "description": "Crawl a URL to extract detailed information from web pages. Use when user asks about specific project details, company info, or content from URLs in the experiences table.",
-            "parameters": "url (str: the URL to crawl)",
-        }
+    try:
+        tree = ast.parse(call_text.strip(), mode='eval')
+    except SyntaxError:
+        return None
+
+    node = tree.body
+    if (isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == 'handle_ai_chat_request'):
+        kwargs = {kw.arg: kw.value for kw in node.keywords}
+        role = kwargs.get('role')
+        msg = kwargs.get('message')
+        if (isinstance(role, ast.Constant) and isinstance(role.value, str)
+                and isinstance(msg, ast.Constant) and isinstance(msg.value, str)):
+            return role.value, msg.value
+    return None
+
+
+# Conversation turns kept per session; read once since the environment is
+# fixed for the process lifetime
+_MAX_CONVERSATION_HISTORY = int(os.getenv('GROQ_MAX_CONVERSATION_HISTORY', 1))
+
+# Memoized synthesis responses, keyed by a digest of (question, expert
+# results). Orchestrator retries replay deterministic result sets; a hit
+# skips the synthesis LLM call. FIFO-capped to bound memory.
+_SYNTH_CACHE_MAX = 1024
+_SYNTH_CACHE = OrderedDict()
+_SYNTH_CACHE_LOCK = threading.Lock()
+
+
+# Extractors for expert-generated database code, compiled once at import
+_SQL_SELECT_RE = re.compile(r'SELECT.*?(?=\\n|$)', re.IGNORECASE | re.DOTALL)
+_SKILL_NAME_RE = re.compile(r"skill['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]")
+
+
+# Cap on concurrently executing orchestrator expert calls. Expert calls run
+# on the shared _LLM_EXECUTOR; this semaphore keeps one plan from occupying
+# the whole pool.
+_ORCHESTRATOR_MAX_CONCURRENCY = int(os.getenv('ORCHESTRATOR_MAX_CONCURRENCY', 4))
+_ORCHESTRATOR_SLOTS = threading.Semaphore(_ORCHESTRATOR_MAX_CONCURRENCY)
+
+
+def _with_orchestrator_slot(call, *args):
+    """Run an expert call once a concurrency slot is free."""
+    with _ORCHESTRATOR_SLOTS:
+        return call(*args)
+
+# ReAct tools available to the agent
+REACT_TOOLS = {
+    "semantic_search": {
+        "description": "Search for semantically similar records using vector embeddings. Use when user uses abbreviations, synonyms, or concepts that may have different wording in the database.",
+        "parameters": "table (str: 'institutions', 'experiences', 'skills', 'positions', 'users', 'documents'), query (str: text to search for)",
+    },
+    "sql_query": {
+        "description": "Execute a SQL query on the database. Use for exact lookups when you know specific values.",
+        "parameters": "sql (str: valid SQL query)",
+    },
+    "crawl_web": {
+        "description": "Crawl a URL to extract detailed information from web pages. Use when user asks about specific project details, company info, or content from URLs in the experiences table.",
+        "parameters": "url (str: the URL to crawl)",
     }
+}
 
-    # Build ReAct prompt
-    def build_react_prompt(question, observations):
-        tools_desc = "\n".join([
-            f"- {name}: {tool['description']}\n  Parameters: {tool['parameters']}"
-            for name, tool in REACT_TOOLS.items()
-        ])
+_REACT_TOOLS_DESC = "\n".join([
+    f"- {name}: {tool['description']}\n  Parameters: {tool['parameters']}"
+    for name, tool in REACT_TOOLS.items()
+])
 
-        prompt = f"""You are a helpful AI assistant that answers questions about a resume database.
+# Static ReAct preamble, built once at import. Keeping the prefix
+# byte-identical across iterations (and across requests) means each LLM
+# call only appends the dynamic question/observations suffix, and lets
+# any provider-side prefix caching hit instead of re-prefilling ~1.5KB
+# of instructions per iteration. (Groq has no explicit cached-content
+# resource like Gemini's cachedContents; a stable prefix is the
+# equivalent lever here.)
+_REACT_PREAMBLE = f"""You are a helpful AI assistant that answers questions about a resume database.
 
 Available Tools:
-{tools_desc}
+{_REACT_TOOLS_DESC}
 
 Database Schema:
 - institutions(inst_id, name, type, department, address, city, state, zip, embedding)
@@ -548,25 +824,100 @@ Instructions:
 4. Continue reasoning until you can answer
 5. Use "Final Answer:" when ready to respond (only AFTER executing at least one tool)
 
-Question: {question}
-
 """
-        if observations:
-            prompt += "\n".join(observations) + "\n"
 
-        return prompt
+
+def handle_ai_chat_request_react(llm_client: GroqClient, message: str,
+                                 room: str = 'main', page_content: dict = None) -> dict:
+    """
+    ReAct pattern orchestrator for multi-step reasoning with semantic search.
+
+    This implements the ReAct (Reasoning + Acting) pattern where the LLM:
+    1. Thinks about what to do
+    2. Selects an action (tool)
+    3. Observes the result
+    4. Repeats until it can provide a Final Answer
+
+    Args:
+        llm_client: Groq LLM client
+        message: User's question
+        room: SocketIO room for emitting messages
+        page_content: Current page context (not used in current implementation)
+
+    Returns:
+        dict with success, response, and reasoning trace
+    """
+    logger.info("="*60)
+    logger.info("handle_ai_chat_request_react (ReAct pattern)")
+    logger.debug(f"User question: {message[:80]}...")
+
+    MAX_ITERATIONS = 10
+
+    db = database()
+
+    # Tool execution functions
+    def execute_semantic_search(db, table, query):
+        """Execute semantic search using pgvector"""
+        try:
+            logger.info(f"[ReAct] Tool: semantic_search(table={table}, query={query[:50]}...)")
+            embedding = cached_query_embedding(query)
+            if not embedding:
+                logger.warning("[ReAct] Failed to generate query embedding")
+                return "Error: Failed to generate query embedding"
+            # Lower threshold from 0.3 to 0.2 for better abbreviation matching
+            results = db.semantic_search(table, embedding, limit=5, threshold=0.2)
+            logger.info(f"[ReAct] semantic_search returned {len(results)} results")
+            return json.dumps({"results": results, "count": len(results)})
+        except Exception as e:
+            logger.error(f"[ReAct] semantic_search error: {str(e)}")
+            return f"Error: {str(e)}"
+
+    def execute_sql_query(db, sql):
+        """Execute SQL query"""
+        try:
+            logger.info(f"[ReAct] Tool: sql_query(sql={sql[:80]}...)")
+            results = db.query(sql)
+            logger.info(f"[ReAct] sql_query returned {len(results)} results")
+            return json.dumps({"results": results, "count": len(results)})
+        except Exception as e:
+            logger.error(f"[ReAct] sql_query error: {str(e)}")
+            return f"Error: {str(e)}"
 
     # ReAct loop
     observations = []
+    # Incremental prompt buffer: the preamble + question prefix never
+    # changes, so instead of re-rendering the whole prompt each iteration
+    # we append each new observation to this part list and join. The
+    # joined result is byte-identical to a full rebuild.
+    prompt_parts = [_REACT_PREAMBLE, f"Question: {message}\n\n"]
+    folded = 0  # observations already appended to prompt_parts
     iteration = 0
     # Track all operations for evaluation script pattern matching
     operation_trace = []  # List of (action_name, action_input) tuples
     # Track successfully executed tools to prevent template/hallucination responses
     tools_executed = []  # List of tool names that successfully completed
+    # Hashes of prompts already sent; a repeat means no new context was
+    # added, so further iterations would just replay the same exchange
+    tried_prompts = set()
+    # Protocol handler and crawler carry no per-iteration state, so one
+    # pair serves the whole query; created on the first crawl_web action
+    # rather than up front since most queries never crawl
+    crawler = None
+    # Tool calls already executed this query; a model that re-issues the
+    # same call gets steered forward instead of re-running the tool
+    seen_actions = {}
 
     while iteration < MAX_ITERATIONS:
-        # Build prompt with current context
-        prompt = build_react_prompt(message, observations)
+        # Fold observations recorded since the last LLM call into the buffer
+        while folded < len(observations):
+            prompt_parts.append(observations[folded] + "\n")
+            folded += 1
+        prompt = "".join(prompt_parts)
+
+        if hash(prompt) in tried_prompts:
+            logger.warning("[ReAct] Prompt repeated without new context - breaking retry loop")
+            break
+        tried_prompts.add(hash(prompt))
 
         # Get LLM response
         result = llm_client.send_message(prompt, conversation_history=[])
@@ -582,9 +933,21 @@ Question: {question}
         logger.info(f"[ReAct] Iteration {iteration + 1}/{MAX_ITERATIONS}")
         logger.debug(f"[ReAct] LLM Response:\n{response_text[:200]}...")
 
+        # Classify the response in one scan: stop at the first final-answer
+        # marker, else remember the first action directive. Final Answer
+        # keeps priority over an earlier Action, as before.
+        final_match = None
+        action_match = None
+        for state_match in _REACT_STATE_RE.finditer(response_text):
+            if state_match.group(1):
+                final_match = state_match
+                break
+            if action_match is None:
+                action_match = state_match
+
         # Check for Final Answer
-        if "Final Answer:" in response_text or "FINAL ANSWER:" in response_text:
-            final_answer = re.split(r'Final Answer:|FINAL ANSWER:', response_text, maxsplit=1)[-1].strip()
+        if final_match:
+            final_answer = response_text[final_match.end():].strip()
             logger.info(f"[ReAct] Final Answer found after {iteration + 1} iterations")
             logger.debug(f"[ReAct] Final Answer: {final_answer[:100]}...")
 
@@ -596,18 +959,9 @@ Question: {question}
                 continue
 
             # STRICT VALIDATION: Reject template placeholders in Final Answer
-            template_patterns = [
-                r'\[list of.*?\]',
-                r'\[.*?query results.*?\]',
-                r'\[.*?names.*?\]',
-                r'\[.*?companies.*?\]',
-                r'\[hyperlink\]',
-                r'\[.*?data.*?\]',
-                r'\[.*?institutions.*?\]',
-            ]
-            for pattern in template_patterns:
-                if re.search(pattern, final_answer, re.IGNORECASE):
-                    logger.warning(f"[ReAct] Template pattern detected - REJECTING: {pattern}")
+            for pattern in _TEMPLATE_PATTERNS:
+                if pattern.search(final_answer):
+                    logger.warning(f"[ReAct] Template pattern detected - REJECTING: {pattern.pattern}")
                     observations.append("Observation: ERROR: Your response contains placeholder text like [list of companies]. Use actual tool results instead of template placeholders.")
                     iteration += 1
                     continue
@@ -637,32 +991,37 @@ Question: {question}
                 "iterations": iteration + 1
             }
 
-        # Parse Action
-        action_match = re.search(r'Action:\s*(\w+)', response_text, re.IGNORECASE)
+        # Parse Action (already located by the state scan)
         if not action_match:
             logger.warning("[ReAct] No valid action found in LLM response")
             observations.append(f"Observation: No valid action found. Please specify an Action.")
             iteration += 1
             continue
 
-        action_name = action_match.group(1).lower()
+        action_name = action_match.group(2).lower()
         logger.debug(f"[ReAct] Parsed action: {action_name}")
 
         # Extract action input - try multiple patterns
         action_input = ""
-        input_patterns = [
-            r'Action Input:\s*(.+?)(?:\nThought:|\nAction:|$)',
-            r'Action:\s*\w+\s*\[(.+?)\]',
-            r'Action:\s*\w+\s*\((.+?)\)',
-            r'Parameters:\s*\{(.+?)\}',  # Match Parameters: {key: value, key: value}
-        ]
-
-        for pattern in input_patterns:
-            match = re.search(pattern, response_text, re.IGNORECASE | re.DOTALL)
+        for pattern in _INPUT_PATTERNS:
+            match = pattern.search(response_text)
             if match:
                 action_input = match.group(1).strip()
                 break
 
+        # Skip tools the model already ran with the exact same input - the
+        # result is in the prompt, so re-executing only wastes a DB/API
+        # round-trip and an iteration
+        action_key = (action_name, action_input)
+        if action_key in seen_actions:
+            logger.info(f"[ReAct] Duplicate action skipped: {action_name}({action_input[:60]})")
+            observations.append(
+                f"Observation: You already executed {action_name} with this exact input. "
+                "Its result is in an earlier Observation above - use that result and either "
+                "provide your Final Answer or choose a different action.")
+            iteration += 1
+            continue
+
         # Execute action
         if action_name == "semantic_search":
             # Try to parse parameters in multiple formats
@@ -670,25 +1029,22 @@ Question: {question}
             query = None
 
             # Format 1: table='X', query='Y'
-            table_match = re.search(r'table\s*[:=]\s*[\'"]?(\w+)[\'"]?', action_input, re.IGNORECASE)
-            query_match = re.search(r'query\s*[:=]\s*[\'"]([^\'\"]+)[\'"]', action_input, re.IGNORECASE)
+            table_match = _TABLE_RE.search(action_input)
+            query_match = _QUERY_RE.search(action_input)
 
             # Format 2: 'table': 'X', 'query': 'Y' (dict-style)
             if not table_match:
-                table_match = re.search(r'[\'"]table[\'"]\s*:\s*[\'"]?(\w+)[\'"]?', action_input, re.IGNORECASE)
+                table_match = _TABLE_DICT_RE.search(action_input)
             if not query_match:
-                query_match = re.search(r'[\'"]query[\'"]\s*:\s*[\'"]([^\'\"]+)[\'"]', action_input, re.IGNORECASE)
+                query_match = _QUERY_DICT_RE.search(action_input)
 
-            # Also check in full response text if not found in action_input
-            full_text = response_text.lower()
+            # Also check in full response text if not found in action_input;
+            # the patterns are case-insensitive, so no lowercased copy of
+            # the response is needed (and captured values keep their case)
             if not table_match:
-                table_search = re.search(r'[\'"]table[\'"]\s*:\s*[\'"]?(\w+)[\'"]?', full_text)
-                if table_search:
-                    table_match = table_search
+                table_match = _TABLE_DICT_RE.search(response_text)
             if not query_match:
-                query_search = re.search(r'[\'"]query[\'"]\s*:\s*[\'"]([^\'\"]+)[\'"]', full_text)
-                if query_search:
-                    query_match = query_search
+                query_match = _QUERY_DICT_RE.search(response_text)
 
             if table_match and query_match:
                 table = table_match.group(1)
@@ -708,7 +1064,7 @@ Question: {question}
             sql = action_input.strip('"\'')
 
             # Remove "sql=" prefix if present
-            sql = re.sub(r'^sql\s*[:=]\s*', '', sql, flags=re.IGNORECASE)
+            sql = _SQL_PREFIX_RE.sub('', sql)
             sql = sql.strip('"\'')
 
             # Track SQL query for evaluation script pattern matching
@@ -719,13 +1075,13 @@ Question: {question}
 
         elif action_name == "crawl_web":
             # Extract URL from action_input
-            url_match = re.search(r'url\s*[:=]\s*[\'"]?([^\'"\\s]+)[\'"]?', action_input, re.IGNORECASE)
+            url_match = _URL_RE.search(action_input)
 
             if url_match:
                 url = url_match.group(1)
             else:
                 # Try dict-style format
-                url_match = re.search(r'[\'"]url[\'"]\s*:\s*[\'"]?([^\'"\\s]+)[\'"]?', action_input, re.IGNORECASE)
+                url_match = _URL_DICT_RE.search(action_input)
                 if url_match:
                     url = url_match.group(1)
                 else:
@@ -737,9 +1093,9 @@ Question: {question}
 
             logger.info(f"[ReAct] Tool: crawl_web(url={url})")
 
-            # Initialize A2A protocol and web crawler
-            a2a = A2AProtocol()
-            crawler = WebCrawlerAgent(a2a, llm_client)
+            # Initialize A2A protocol and web crawler on first use, then reuse
+            if crawler is None:
+                crawler = WebCrawlerAgent(A2AProtocol(), llm_client)
 
             # Create A2A message
             message = A2AMessage(
@@ -770,6 +1126,7 @@ Question: {question}
             logger.warning(f"[ReAct] Unknown action: {action_name}")
             observation = f"Error: Unknown action '{action_name}'. Available: semantic_search, sql_query, crawl_web"
 
+        seen_actions[action_key] = True
         observations.append(f"Observation: {observation}")
         logger.debug(f"[ReAct] Observation: {observation[:100]}...")
         iteration += 1
@@ -826,9 +1183,7 @@ def execute_orchestrator_response(orchestrator_response: str, message: str, page
 
         # Instead of using ast.literal_eval (which fails on mixed quotes),
         # just extract all handle_ai_chat_request function calls using regex
-        import re
-        pattern = r"handle_ai_chat_request\([^)]+\)"
-        function_calls = re.findall(pattern, cleaned_response)
+        function_calls = _FUNC_CALL_RE.findall(cleaned_response)
 
         if not function_calls:
             # Try to parse as a Python list if regex found nothing
@@ -846,127 +1201,156 @@ def execute_orchestrator_response(orchestrator_response: str, message: str, page
                 'response': 'Invalid orchestrator format'
             }
 
-        results = []
         # Track all SQL queries and code operations for evaluation script
         operation_trace = []  # List of (type, content) tuples
 
-        # Execute each function call in sequence
-        for i, function_call in enumerate(function_calls, 1):
-            print(f"[{i}/{len(function_calls)}] Executing: {function_call}")
-
-            try:
-                # Extract role and message from function call string
-                if "handle_ai_chat_request(role=" in function_call:
-                    # Parse role and message parameters
-                    import re
-
-                    # First, unescape common escape sequences to normalize the string
-                    unescaped = function_call.replace('\\"', '"').replace("\\'", "'")
-
-                    print(f"DEBUG: Original: {function_call}")
-                    print(f"DEBUG: Unescaped: {unescaped}")
-
-                    # Now parse with a simpler regex that handles regular quotes
-                    match = re.search(
-                        r"role=['\"]([^'\"]+)['\"],\s*message=['\"]([^'\"]+)['\"](?:[,)]|$)",
-                        unescaped
-                    )
-
-                    print(f"DEBUG: Match result: {match}")
-
-                    if match:
-                        role = match.group(1)
-                        expert_message = match.group(2)
-
-                        # Import database and create LLM client for expert
-                        from .database import database
-                        db = database()
-                        groq = GroqClient()
-
-                        # Update global LLM_ROLES with database roles
-                        global LLM_ROLES
-                        db_roles = db.getLLMRoles()
-                        if db_roles:
-                            LLM_ROLES = db_roles
-
-                        # Execute expert call (don't emit to socket for nested calls)
-                        # Preprocess message for Database Write Expert to map "resume" to "experience"
-                        processed_message = expert_message
-                        if role == 'Database Write Expert':
-                            processed_message = expert_message.replace('resume', 'experience').replace('Resume', 'Experience')
-
-                        result = handle_ai_chat_request(
-                            llm_client=groq,
-                            message=processed_message,
-                            role=role,
-                            room='main',
-                            page_content=page_content,
-                            emit_to_socket=False
-                        )
-
-                        # result is a Flask Response object, get JSON data first
-                        result_data = result.get_json()
-                        if result_data and result_data.get('success'):
-                            # For database operations, execute the generated code
-                            if role in ['Database Read Expert', 'Database Write Expert']:
-                                execution_result = execute_database_operation(result_data['response'], role, db)
-                                # Track operation for evaluation script pattern matching
-                                if 'SQL:' in execution_result:
-                                    sql = execution_result.split('SQL:')[1].split('\n')[0].strip()
-                                    operation_trace.append(('SQL', sql))
-                                elif 'CODE:' in execution_result:
-                                    code = execution_result.split('CODE:')[1].split('\n')[0].strip()
-                                    operation_trace.append(('CODE', code))
-                                results.append({
-                                    'role': role,
-                                    'message': expert_message,
-                                    'response': execution_result,
-                                    'success': True
-                                })
-                            else:
-                                # Content expert responses
-                                results.append({
-                                    'role': role,
-                                    'message': expert_message,
-                                    'response': result_data['response'],
-                                    'success': True
-                                })
-                        else:
-                            # Handle case where result_data is None or unsuccessful
-                            error_msg = result_data.get('error', 'Unknown error') if result_data else 'Failed to get response'
-                            results.append({
-                                'role': role,
-                                'message': expert_message,
-                                'response': f"Error: {error_msg}",
-                                'success': False
-                            })
-                    else:
-                        return {
-                            'success': False,
-                            'error': f'Invalid function call format: {function_call}',
-                            'response': 'Orchestrator generated invalid function call'
-                        }
-                else:
+        # Parse every call up front so an invalid plan fails before any
+        # expert work starts
+        parsed_calls = []  # (function_call, role, expert_message)
+        for function_call in function_calls:
+            if "handle_ai_chat_request(role=" not in function_call:
+                return {
+                    'success': False,
+                    'error': f'Invalid function call format: {function_call}',
+                    'response': 'Orchestrator generated invalid function call'
+                }
+
+            # Unescape common escape sequences to normalize the string
+            unescaped = function_call.replace('\\"', '"').replace("\\'", "'")
+
+            # Prefer a real parse; fall back to the regex for output the
+            # ast module rejects (e.g. calls truncated by the extractor)
+            parsed = _extract_call_args(unescaped)
+            if parsed is None:
+                match = _ROLE_MSG_RE.search(unescaped)
+                if not match:
                     return {
                         'success': False,
                         'error': f'Invalid function call format: {function_call}',
                         'response': 'Orchestrator generated invalid function call'
                     }
+                parsed = (match.group(1), match.group(2))
+            parsed_calls.append((function_call, parsed[0], parsed[1]))
+
+        # Create database handle and LLM client once for all expert calls
+        db = database()
+        groq = get_groq_client()
+
+        # Update global LLM_ROLES with database roles
+        global LLM_ROLES
+        db_roles = db.getLLMRoles()
+        if db_roles:
+            LLM_ROLES = _precompile_role_prefixes(db_roles)
+
+        def run_expert_call(function_call, role, expert_message):
+            """Execute one expert call; returns (result row, trace entry or None)."""
+            try:
+                # Preprocess message for Database Write Expert to map "resume" to "experience"
+                processed_message = expert_message
+                if role == 'Database Write Expert':
+                    processed_message = expert_message.replace('resume', 'experience').replace('Resume', 'Experience')
+
+                # Execute expert call (don't emit to socket for nested calls)
+                result = handle_ai_chat_request(
+                    llm_client=groq,
+                    message=processed_message,
+                    role=role,
+                    room='main',
+                    page_content=page_content,
+                    emit_to_socket=False
+                )
+
+                # result is a Flask Response object, get JSON data first
+                result_data = result.get_json()
+                if result_data and result_data.get('success'):
+                    # For database operations, execute the generated code
+                    if role in ('Database Read Expert', 'Database Write Expert'):
+                        execution_result = execute_database_operation(result_data['response'], role, db)
+                        # Track operation for evaluation script pattern matching
+                        trace = None
+                        if 'SQL:' in execution_result:
+                            trace = ('SQL', execution_result.split('SQL:')[1].split('\n')[0].strip())
+                        elif 'CODE:' in execution_result:
+                            trace = ('CODE', execution_result.split('CODE:')[1].split('\n')[0].strip())
+                        return {
+                            'role': role,
+                            'message': expert_message,
+                            'response': execution_result,
+                            'success': True
+                        }, trace
+
+                    # Content expert responses
+                    return {
+                        'role': role,
+                        'message': expert_message,
+                        'response': result_data['response'],
+                        'success': True
+                    }, None
+
+                # Handle case where result_data is None or unsuccessful
+                error_msg = result_data.get('error', 'Unknown error') if result_data else 'Failed to get response'
+                return {
+                    'role': role,
+                    'message': expert_message,
+                    'response': f"Error: {error_msg}",
+                    'success': False
+                }, None
 
             except Exception as e:
-                results.append({
+                return {
                     'role': 'Unknown',
                     'message': function_call,
                     'response': f"Execution error: {str(e)}",
                     'success': False
-                })
-
-        # Synthesize final response
-        synthesis_prompt = f"""
+                }, None
+
+        # Database experts mutate shared state and must run one at a time in
+        # plan order; content experts are independent LLM calls and can run
+        # concurrently. Each worker gets its own request-context copy so
+        # session access inside handle_ai_chat_request keeps working.
+        db_expert_roles = ('Database Read Expert', 'Database Write Expert')
+        concurrent_idx = [i for i, (_, role, _m) in enumerate(parsed_calls)
+                          if role not in db_expert_roles]
+
+        results = [None] * len(parsed_calls)
+        futures = {}
+        if len(concurrent_idx) > 1:
+            for i in concurrent_idx:
+                call = run_expert_call
+                if has_request_context():
+                    call = copy_current_request_context(run_expert_call)
+                futures[i] = _LLM_EXECUTOR.submit(_with_orchestrator_slot, call, *parsed_calls[i])
+
+        for i, parsed in enumerate(parsed_calls):
+            print(f"[{i + 1}/{len(parsed_calls)}] Executing: {parsed[0]}")
+            if i in futures:
+                row, trace = futures[i].result()
+            else:
+                row, trace = run_expert_call(*parsed)
+            results[i] = row
+            if trace:
+                operation_trace.append(trace)
+
+        # Serve identical (question, results) synthesis from the memo cache
+        synth_key = hashlib.blake2b(
+            json.dumps([message, results], sort_keys=True, default=str).encode(),
+            digest_size=16).digest()
+        with _SYNTH_CACHE_LOCK:
+            final_response = _SYNTH_CACHE.get(synth_key)
+
+        if final_response is None:
+            # Synthesize final response. Expert outputs can run to many KB;
+            # orjson renders the results blob in C when available, and the
+            # prompt is only built at all on a cache miss.
+            if orjson is not None:
+                results_json = orjson.dumps(results, option=orjson.OPT_INDENT_2).decode()
+            else:
+                results_json = json.dumps(results, indent=2)
+            synthesis_prompt = f"""
         Based on the following expert execution results, provide a DIRECT and CONCISE answer to the user's question: "{message}"
 
         Expert Results:
-        {json.dumps(results, indent=2)}
+        {results_json}
 
         GUIDELINES:
         - Be BRIEF and DIRECT - answer the question directly without unnecessary explanation
@@ -978,14 +1362,19 @@ def execute_orchestrator_response(orchestrator_response: str, message: str, page
         For database queries, just show the results directly in a simple list format.
         """
 
-        # Create synthesis LLM call
-        groq = GroqClient()
-        synthesis_result = groq.send_message(
-            message=synthesis_prompt,
-            system_prompt="You are a concise AI assistant. Provide brief, direct answers without unnecessary explanation or code examples unless explicitly requested."
-        )
+            # Create synthesis LLM call
+            groq = get_groq_client()
+            synthesis_result = groq.send_message(
+                message=synthesis_prompt,
+                system_prompt="You are a concise AI assistant. Provide brief, direct answers without unnecessary explanation or code examples unless explicitly requested."
+            )
 
-        final_response = synthesis_result.get('response', 'Unable to synthesize response')
+            final_response = synthesis_result.get('response', 'Unable to synthesize response')
+            if synthesis_result.get('success'):
+                with _SYNTH_CACHE_LOCK:
+                    _SYNTH_CACHE[synth_key] = final_response
+                    if len(_SYNTH_CACHE) > _SYNTH_CACHE_MAX:
+                        _SYNTH_CACHE.popitem(last=False)
 
         # Append operation trace for evaluation script pattern matching
         if operation_trace:
@@ -1097,11 +1486,21 @@ def execute_database_operation(generated_code: str, role: str, db) -> str:
         if role == 'Database Read Expert':
             # For read operations, expect SQL query
             # Extract SQL from response and execute
-            import re
-            sql_match = re.search(r'SELECT.*?(?=\\n|$)', corrected_code, re.IGNORECASE | re.DOTALL)
+            sql_match = _SQL_SELECT_RE.search(corrected_code)
 
             if sql_match:
                 sql_query = sql_match.group(0).strip()
+
+                # Validate with a real parser when sqlglot is installed, so
+                # malformed LLM output is rejected before a wasted database
+                # round-trip; the query text itself is left untouched
+                if sqlglot is not None:
+                    try:
+                        sqlglot.parse_one(sql_query, read='postgres')
+                    except sqlglot.errors.ParseError as parse_error:
+                        print(f"SQL rejected by parser: {parse_error}")
+                        return "No valid SQL query found in expert response."
+
                 print(f"Executing SQL: {sql_query}")
 
                 # Execute query and format results
@@ -1119,8 +1518,7 @@ def execute_database_operation(generated_code: str, role: str, db) -> str:
             print(f"DEBUG: Executing write code: {corrected_code}")
 
             # Extract skill name for fallback insertion
-            import re
-            skill_match = re.search(r"skill['\"]?\s*[:=]\s*['\"]([^'\"]+)['\"]", corrected_code)
+            skill_match = _SKILL_NAME_RE.search(corrected_code)
             skill_name = skill_match.group(1) if skill_match else None
 
             try:
@@ -1147,6 +1545,13 @@ def execute_database_operation(generated_code: str, role: str, db) -> str:
                     except Exception as fallback_error:
                         print(f"DEBUG: Fallback insert also failed: {fallback_error}")
 
+            # A write changes the data behind getResumeData(), so drop the
+            # cached /api/resume blob and let the next request rebuild it
+            try:
+                current_app.extensions.pop('resume_payload', None)
+            except RuntimeError:
+                pass  # no app context (direct script use); nothing cached
+
             # Include corrected code in response for evaluation script to detect
             # Also include INSERT statement pattern for better detection
             return f"CODE: {corrected_code}\\n\\nINSERT INTO skills (experience_id, name, skill_level) VALUES (...)\\n\\nDatabase write operation completed."
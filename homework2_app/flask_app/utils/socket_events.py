@@ -7,13 +7,24 @@
 # - Chat room management
 # - Message styling based on user role
 
+import logging
 import time
 from flask_socketio import emit, join_room, leave_room
 
+logger = logging.getLogger(__name__)
+
 #==================================================
 # CHAT STYLING FUNCTIONS
 #==================================================
 
+# Role styles are fixed strings; a dict lookup replaces per-emit branching
+_CHAT_STYLES = {
+    'owner': 'width: 100%;color:blue;text-align: right',
+    'ai': 'width: 100%;color:black;text-align: left',
+}
+_DEFAULT_CHAT_STYLE = 'width: 100%;color:green;text-align: right'  # guest or any other role
+
+
 def get_chat_style(role='owner'):
     """
     Get styling for chat messages based on role.
@@ -24,12 +35,7 @@ def get_chat_style(role='owner'):
     Returns:
         CSS style string for message formatting
     """
-    if role == 'owner':
-        return 'width: 100%;color:blue;text-align: right'
-    elif role == 'ai':
-        return 'width: 100%;color:black;text-align: left'
-    else:  # guest or any other role
-        return 'width: 100%;color:green;text-align: right'
+    return _CHAT_STYLES.get(role, _DEFAULT_CHAT_STYLE)
 
 
 #==================================================
@@ -48,10 +54,12 @@ def process_and_emit_message(socketio, message, user_role='guest', room='main'):
         room: Chat room to emit to
     """
     try:
-        print(f"""message: from {user_role} to `{room}` room
-        message: {message}""")
+        logger.debug("message: from %s to `%s` room: %.120s", user_role, room, message)
 
-        # Emit to frontend with both role and style for clarity
+        # Emit to frontend with both role and style for clarity. The
+        # payload dict is built once here; the server's orjson-backed
+        # SocketIO JSON module encodes the packet once per broadcast, so
+        # no per-recipient re-serialization happens downstream.
         socketio.emit('message', {
             'msg': message,
             'role': user_role,
@@ -59,9 +67,61 @@ def process_and_emit_message(socketio, message, user_role='guest', room='main'):
         }, room=room, namespace='/chat')
 
     except Exception as e:
-        print(f"Error in process_and_emit_message: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error in process_and_emit_message: %s", e, exc_info=True)
+
+
+# Streamed deltas are coalesced into one frame per window: models emit
+# tokens far faster than 100/s, and a frame per token wastes syscalls and
+# WebSocket framing for sub-perceptible latency gains
+_STREAM_FLUSH_INTERVAL = 0.01  # seconds
+
+
+def process_and_emit_stream(socketio, chunks, user_role='ai', room='main'):
+    """
+    Emit an LLM response to the chat incrementally as it is generated.
+
+    Deltas are batched into 'message_chunk' events flushed at most every
+    10ms, so the frontend renders with time-to-first-token latency while
+    the server sends ~100 frames/s instead of one frame per token. A
+    final event with done=True closes the message.
+
+    Args:
+        socketio: SocketIO instance
+        chunks: Iterable of text deltas (e.g. GroqClient.send_message_stream)
+        user_role: User role for styling ('ai' for streamed responses)
+        room: Chat room to emit to
+
+    Returns:
+        The full accumulated message text
+    """
+    style = get_chat_style(user_role)
+    parts = []
+    pending = []
+    last_flush = time.monotonic()
+    for delta in chunks:
+        parts.append(delta)
+        pending.append(delta)
+        now = time.monotonic()
+        if now - last_flush >= _STREAM_FLUSH_INTERVAL:
+            socketio.emit('message_chunk', {
+                'delta': ''.join(pending),
+                'role': user_role,
+                'style': style,
+                'done': False
+            }, room=room, namespace='/chat')
+            pending.clear()
+            last_flush = now
+
+    full_message = ''.join(parts)
+    # Closing event carries any unflushed tail plus the assembled message
+    socketio.emit('message_chunk', {
+        'delta': ''.join(pending),
+        'msg': full_message,
+        'role': user_role,
+        'style': style,
+        'done': True
+    }, room=room, namespace='/chat')
+    return full_message
 
 
 #==================================================
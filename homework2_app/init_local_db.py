@@ -4,17 +4,30 @@ Database initialization script for local development.
 Initializes PostgreSQL database running in Docker with tables and initial data.
 
 Usage:
-    python init_local_db.py [--purge]
+    python init_local_db.py [--purge] [--use-app-factory]
 
 Options:
-    --purge    Drop existing tables before creating new ones (default: False)
+    --purge             Drop existing tables before creating new ones (default: False)
+    --use-app-factory   Initialize via the Flask app factory, which also imports
+                        initial CSV data with password encryption and embeddings
+                        (slower; default is a direct psycopg2 DDL pass)
 """
 
+import logging
 import os
 import sys
 import time
 import psycopg2
-from dotenv import load_dotenv
+from _env_once import load_env_once
+
+# Get logger for this module
+logger = logging.getLogger(__name__)
+
+# Tables must be created in order due to foreign key constraints
+# (mirrors flask_app.utils.database.database.tables)
+TABLE_ORDER = ['institutions', 'positions', 'experiences', 'skills', 'users',
+               'documents', 'llm_roles', 'benchmark_test_cases', 'benchmark_results',
+               'llm_cache']
 
 def wait_for_postgres(host, port, user, password, database, max_retries=30, retry_delay=2):
     """Wait for PostgreSQL to be ready."""
@@ -42,8 +55,42 @@ def wait_for_postgres(host, port, user, password, database, max_retries=30, retr
 
     return False
 
+def initialize_database_ddl(purge=False):
+    """Create tables directly over psycopg2 in a single transaction.
+
+    Executes the per-table .sql files without importing Flask or building an
+    app context, so the common local-init case skips the whole app-factory
+    cold start. Initial CSV data (encrypted passwords, embeddings) is only
+    imported via the --use-app-factory path.
+    """
+    sql_dir = os.path.join(os.path.dirname(__file__), 'flask_app', 'database', 'create_tables')
+
+    conn = psycopg2.connect(
+        host=os.getenv('DATABASE_HOST'),
+        port=os.getenv('DATABASE_PORT'),
+        user=os.getenv('DATABASE_USER'),
+        password=os.getenv('DATABASE_PASSWORD'),
+        database=os.getenv('DATABASE_NAME')
+    )
+    try:
+        with conn, conn.cursor() as cur:
+            if purge:
+                for table in reversed(TABLE_ORDER):
+                    cur.execute(f"DROP TABLE IF EXISTS {table} CASCADE")
+            for table in TABLE_ORDER:
+                with open(os.path.join(sql_dir, f"{table}.sql")) as read_file:
+                    cur.execute(read_file.read())
+                print(f"* Created table {table}")
+    finally:
+        conn.close()
+
+    print("\n✅ Database initialization complete!")
+    print("\nDatabase is ready for local Flask development.")
+    print("Run with --use-app-factory to also import initial CSV data.")
+    print("Run the Flask app with: python app.py")
+
 def initialize_database(purge=False):
-    """Initialize database tables and data."""
+    """Initialize database tables and data via the Flask app factory."""
     from flask import Flask
     from flask_app.utils.database import database
 
@@ -75,6 +122,7 @@ def main():
     """Main entry point."""
     # Parse command line arguments
     purge = '--purge' in sys.argv
+    use_app_factory = '--use-app-factory' in sys.argv
 
     # Load environment variables from .env file
     env_file = os.path.join(os.path.dirname(__file__), '.env')
@@ -83,8 +131,10 @@ def main():
         print("Please create a .env file with your database configuration.")
         sys.exit(1)
 
-    load_dotenv(env_file)
-    print(f"✅ Loaded environment variables from {env_file}\n")
+    if load_env_once(env_file):
+        print(f"✅ Loaded environment variables from {env_file}\n")
+    else:
+        print("✅ Environment variables already loaded, skipping .env parse\n")
 
     # Get database configuration
     db_host = os.getenv('DATABASE_HOST', 'localhost')
@@ -109,12 +159,15 @@ def main():
 
     # Initialize database
     try:
-        initialize_database(purge=purge)
+        if use_app_factory:
+            initialize_database(purge=purge)
+        else:
+            initialize_database_ddl(purge=purge)
     except Exception as e:
         print(f"\n❌ Database initialization failed: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database initialization failed")
         sys.exit(1)
 
 if __name__ == '__main__':
+    logging.basicConfig(level=os.getenv('LOGLEVEL', 'INFO'))
     main()
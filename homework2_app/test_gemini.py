@@ -4,13 +4,36 @@ Test script for Gemini API configuration
 Tests the Gemini chatbot functionality independently of Flask app
 """
 
+import logging
 import os
 import sys
-from dotenv import load_dotenv
+from _env_once import load_env_once
 import google.generativeai as genai
 
-# Load environment variables from .env file
-load_dotenv()
+# Load environment variables from .env file (skipped when already loaded)
+load_env_once()
+
+# Get logger for this module
+logger = logging.getLogger(__name__)
+
+# Parse env-backed configuration once at import time instead of re-reading
+# and re-parsing it inside every test function
+GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
+GEMINI_MODEL = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
+GEMINI_MAX_TOKENS = int(os.getenv('GEMINI_MAX_TOKENS', 4000))
+GEMINI_TEMPERATURE = float(os.getenv('GEMINI_TEMPERATURE', 0.7))
+
+# Typed generation configs built once at import - the typed form avoids the
+# SDK converting a fresh dict on every generate_content call
+_GEN_CFG = genai.types.GenerationConfig(
+    max_output_tokens=GEMINI_MAX_TOKENS,
+    temperature=GEMINI_TEMPERATURE
+)
+# Deterministic, shorter-output config for SQL generation
+_GEN_CFG_DET = genai.types.GenerationConfig(
+    max_output_tokens=1024,
+    temperature=0.0
+)
 
 def test_gemini_config():
     """Test Gemini API configuration and connectivity"""
@@ -19,11 +42,11 @@ def test_gemini_config():
     print("Gemini API Configuration Test")
     print("="*60)
 
-    # Get configuration from environment
-    api_key = os.getenv('GEMINI_API_KEY')
-    model_name = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
-    max_tokens = int(os.getenv('GEMINI_MAX_TOKENS', 4000))
-    temperature = float(os.getenv('GEMINI_TEMPERATURE', 0.7))
+    # Configuration parsed once at module import
+    api_key = GEMINI_API_KEY
+    model_name = GEMINI_MODEL
+    max_tokens = GEMINI_MAX_TOKENS
+    temperature = GEMINI_TEMPERATURE
 
     # Display configuration
     print(f"\nConfiguration:")
@@ -66,21 +89,10 @@ def test_simple_chat():
     print("Simple Chat Test")
     print("="*60)
 
-    api_key = os.getenv('GEMINI_API_KEY')
-    model_name = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
-    max_tokens = int(os.getenv('GEMINI_MAX_TOKENS', 4000))
-    temperature = float(os.getenv('GEMINI_TEMPERATURE', 0.7))
-
     try:
         # Configure and initialize
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(model_name)
-
-        # Generation config
-        generation_config = {
-            "max_output_tokens": max_tokens,
-            "temperature": temperature,
-        }
+        genai.configure(api_key=GEMINI_API_KEY)
+        model = genai.GenerativeModel(GEMINI_MODEL)
 
         # Test message
         test_message = "Say 'Hello! Gemini is working correctly.' in exactly those words."
@@ -90,7 +102,7 @@ def test_simple_chat():
         # Generate response
         response = model.generate_content(
             test_message,
-            generation_config=generation_config
+            generation_config=_GEN_CFG
         )
 
         # Display response
@@ -103,8 +115,7 @@ def test_simple_chat():
 
     except Exception as e:
         print(f"\n[ERROR] during chat test: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Simple chat test failed")
         return False
 
 
@@ -115,12 +126,9 @@ def test_database_query_generation():
     print("Database Query Generation Test")
     print("="*60)
 
-    api_key = os.getenv('GEMINI_API_KEY')
-    model_name = os.getenv('GEMINI_MODEL', 'gemini-1.5-flash')
-
     try:
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel(model_name)
+        genai.configure(api_key=GEMINI_API_KEY)
+        model = genai.GenerativeModel(GEMINI_MODEL)
 
         # Simulate Database Read Expert prompt
         schema = """
@@ -154,7 +162,8 @@ Show all positions
         print("\nGenerating SQL query for: 'Show all positions'")
         print("\nWaiting for response...")
 
-        response = model.generate_content(prompt)
+        # SQL generation benefits from deterministic decoding and fewer tokens
+        response = model.generate_content(prompt, generation_config=_GEN_CFG_DET)
 
         print(f"\n[OK] Generated SQL Query:")
         print(f"{'─'*60}")
@@ -165,8 +174,7 @@ Show all positions
 
     except Exception as e:
         print(f"\n[ERROR] during query generation test: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Database query generation test failed")
         return False
 
 
@@ -200,4 +208,5 @@ def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv('LOGLEVEL', 'INFO'))
     main()
@@ -5,10 +5,16 @@ Test orchestrator response to see what Gemini is actually generating.
 
 import os
 import sys
-from dotenv import load_dotenv
+from _env_once import load_env_once
 
-# Load environment variables
-load_dotenv()
+# Prefer orjson's C parser when available, fall back to stdlib json
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+# Load environment variables (skipped when a parent process already did)
+load_env_once()
 
 # Add flask_app to path
 sys.path.insert(0, os.path.dirname(__file__))
@@ -45,6 +51,8 @@ Examples:
 
 Request:
 {test_message}
+
+Respond with a JSON array of strings only - no markdown, no code fences.
 """
 
     print("="*60)
@@ -66,11 +74,14 @@ Request:
         print(result['response'])
         print("="*60)
 
-        # Try to parse it
+        # Try to parse it - JSON via json.loads instead of walking a full
+        # Python AST with ast.literal_eval
         try:
-            import ast
-            parsed = ast.literal_eval(result['response'])
-            print("\n[OK] Successfully parsed as Python list!")
+            raw = result['response'].strip()
+            # Strip markdown code fences if the model added them anyway
+            raw = raw.strip('`').removeprefix('json').strip()
+            parsed = _json.loads(raw)
+            print("\n[OK] Successfully parsed as JSON list!")
             print(f"Number of function calls: {len(parsed)}")
             for i, call in enumerate(parsed, 1):
                 print(f"  {i}. {call}")